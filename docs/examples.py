@@ -32,9 +32,10 @@ Examples:
 
 """
 
+import importlib
 import sys
 
-from src.cli.main import cli
+import click
 
 
 def usage() -> None:
@@ -67,8 +68,6 @@ def usage() -> None:
             python -m src.cli.main version
 
     """
-    import click
-
     click.echo("""
 Usage: python -m src.cli.main [OPTIONS] COMMAND [ARGS]
 
@@ -132,11 +131,11 @@ def main() -> None:
         Exit code: 1
 
     """
-    if len(sys.argv) == 1:
+    if not sys.argv[1:]:
         usage()
         sys.exit(1)
 
-    cli()
+    importlib.import_module("src.cli.main").cli()
 
 
 if __name__ == "__main__":
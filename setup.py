@@ -1,18 +1,42 @@
 """Setup script for the Agentic Problem Solver package."""
 
+from functools import cache
 from pathlib import Path
 
-from setuptools import find_packages, setup
+from setuptools import setup
 
-with Path("README.md").open(encoding="utf-8") as f:
-    long_description = f.read()
+
+@cache
+def _long_description() -> str:
+    """Read the README once per process."""
+    return Path("README.md").read_text(encoding="utf-8")
+
+
+# Listed explicitly rather than discovered with find_packages(): ``src`` has no
+# __init__.py, so discovery misses it, and a tree walk is wasted work here.
+PACKAGES = [
+    "src",
+    "src.agent",
+    "src.agent.agent_types",
+    "src.agent.state",
+    "src.cli",
+    "src.common_types",
+    "src.config",
+    "src.llm_providers",
+    "src.llm_providers.config",
+    "src.llm_providers.providers",
+    "src.llm_providers.utils",
+    "src.messages",
+    "src.utils",
+]
 
 setup(
     name="agentic_problem_solver",
     version="0.1.0",
-    packages=find_packages(),
+    packages=PACKAGES,
     include_package_data=True,
     install_requires=[
+        "anyio>=4.0.0",
         "click>=8.0.0",
         "python-dotenv>=1.0.0",
         "langchain>=0.1.0",
@@ -31,7 +55,7 @@ setup(
     author="Your Name",
     author_email="your.email@example.com",
     description="An AI-powered problem-solving system",
-    long_description=long_description,
+    long_description=_long_description(),
     long_description_content_type="text/markdown",
     url="https://github.com/yourusername/Agentic_problem_solver",
     classifiers=[
@@ -1,9 +1,59 @@
-"""Agent package."""
+"""Agent package.
 
-from src.agent.agent_types.agent_types import Agent, Message, StepResult
+Exports are resolved lazily on first attribute access so that importing a
+submodule does not pull in every sibling module.
+"""
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.agent.agent_types.agent_types import Agent, Message, StepResult
+    from src.agent.base import BaseAgent
+    from src.agent.state.base import AgentState, InMemoryStateManager, StateManager
+
+_LAZY_IMPORTS = {
+    "Agent": "src.agent.agent_types.agent_types",
+    "AgentState": "src.agent.state.base",
+    "BaseAgent": "src.agent.base",
+    "InMemoryStateManager": "src.agent.state.base",
+    "Message": "src.agent.agent_types.agent_types",
+    "StateManager": "src.agent.state.base",
+    "StepResult": "src.agent.agent_types.agent_types",
+}
 
 __all__ = [
     "Agent",
+    "AgentState",
+    "BaseAgent",
+    "InMemoryStateManager",
     "Message",
+    "StateManager",
     "StepResult",
 ]
+
+
+def __getattr__(name: str) -> object:
+    """Import an exported name on first access.
+
+    Args:
+        name: Attribute name.
+
+    Returns:
+        The exported object.
+
+    Raises:
+        AttributeError: If the name is not exported.
+
+    """
+    if name not in _LAZY_IMPORTS:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List module attributes, including lazy exports."""
+    return sorted({*globals(), *_LAZY_IMPORTS})
@@ -1,15 +1,58 @@
-"""Agent types package."""
+"""Agent types package.
 
-from src.agent.agent_types.agent_types import (
-    Agent,
-    Message,
-    Result,
-    StepResult,
-)
+Exports are resolved lazily on first attribute access.
+"""
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.agent.agent_types.agent_types import (
+        Agent,
+        Message,
+        Result,
+        StepKwargs,
+        StepResult,
+    )
+
+_LAZY_IMPORTS = {
+    "Agent": "src.agent.agent_types.agent_types",
+    "Message": "src.agent.agent_types.agent_types",
+    "Result": "src.agent.agent_types.agent_types",
+    "StepKwargs": "src.agent.agent_types.agent_types",
+    "StepResult": "src.agent.agent_types.agent_types",
+}
 
 __all__ = [
     "Agent",
     "Message",
     "Result",
+    "StepKwargs",
     "StepResult",
 ]
+
+
+def __getattr__(name: str) -> object:
+    """Import an exported name on first access.
+
+    Args:
+        name: Attribute name.
+
+    Returns:
+        The exported object.
+
+    Raises:
+        AttributeError: If the name is not exported.
+
+    """
+    if name not in _LAZY_IMPORTS:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List module attributes, including lazy exports."""
+    return sorted({*globals(), *_LAZY_IMPORTS})
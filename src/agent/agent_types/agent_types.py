@@ -1,29 +1,50 @@
 """Agent type definitions."""
 
 from collections.abc import AsyncGenerator
-from dataclasses import dataclass
-from typing import Generic, Protocol, TypeVar
+from dataclasses import dataclass, field
+from types import GenericAlias
+from typing import TYPE_CHECKING, Any, Protocol, TypeVar
 
 T = TypeVar("T")
 U = TypeVar("U")
 
+# Value type of keyword arguments passed to step functions.
+StepKwargs = Any
 
-@dataclass
+# Result is generic for type checkers only; at runtime it subclasses object and
+# is subscripted through types.GenericAlias, skipping typing.Generic machinery.
+if TYPE_CHECKING:
+    from typing import Generic
+
+    _ResultBase = Generic[T]
+else:
+    _ResultBase = object
+
+
+@dataclass(slots=True, frozen=True)
 class Message:
-    """Message exchanged between agents."""
+    """Message exchanged between agents.
+
+    The message itself is immutable; ``metadata`` is a mutable mapping that is
+    excluded from equality and hashing.
+    """
 
     role: str
     content: str
+    metadata: dict[str, Any] = field(default_factory=dict, compare=False)
 
 
-@dataclass
-class Result(Generic[T]):
+@dataclass(slots=True, frozen=True)
+class Result(_ResultBase):
     """Step execution result."""
 
     success: bool
     data: T
     error: str = ""
 
+    if not TYPE_CHECKING:
+        __class_getitem__ = classmethod(GenericAlias)
+
     def __post_init__(self) -> None:
         """Validate result."""
         if not self.success and not self.error:
@@ -2,6 +2,10 @@
 
 from enum import Enum
 
+from src.common_types.enums import MessageRole
+
+__all__ = ["AgentStatus", "MessageRole", "StepType"]
+
 
 class AgentStatus(str, Enum):
     """Agent status enumeration."""
@@ -12,15 +16,6 @@ class AgentStatus(str, Enum):
     DONE = "done"
 
 
-class MessageRole(str, Enum):
-    """Message role types."""
-
-    SYSTEM = "system"
-    USER = "user"
-    ASSISTANT = "assistant"
-    TOOL = "tool"
-
-
 class StepType(str, Enum):
     """Step types."""
 
@@ -3,13 +3,13 @@
 import logging
 from abc import ABC, abstractmethod
 from collections.abc import AsyncGenerator
+from functools import cached_property
 from typing import Any, TypeVar
 
 from src.agent.agent_types.agent_types import Agent
 from src.agent.agent_types.agent_types import Result as StepResult
 from src.agent.state.base import AgentState
 from src.config.agent import AgentConfig
-from src.utils.log_utils import setup_logging
 
 logger = logging.getLogger(__name__)
 
@@ -28,11 +28,19 @@ class BaseAgent(Agent[T, U], ABC):
 
         """
         self.config = config or AgentConfig()
-        self.state = AgentState()
         self.step_executor = None
         self._provider = None
         self._config = None
-        setup_logging()
+
+    @cached_property
+    def state(self) -> AgentState:
+        """Agent state, created on first access.
+
+        Returns:
+            Current agent state.
+
+        """
+        return AgentState(self.config.max_messages)
 
     def add_step(self, step: StepResult[T]) -> None:
         """Add a processing step.
@@ -117,12 +125,13 @@ class BaseAgent(Agent[T, U], ABC):
     def update_state(self, **kwargs: dict[str, Any]) -> None:
         """Update agent state.
 
+        Keys that are not state fields are ignored.
+
         Args:
             **kwargs: State updates.
 
         """
-        for key, value in kwargs.items():
-            setattr(self.state, key, value)
+        self.state.update(**kwargs)
 
     def clear_state(self) -> None:
         """Clear agent state."""
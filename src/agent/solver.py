@@ -1,6 +1,8 @@
 """Solver agent module."""
 
+from collections import OrderedDict
 from collections.abc import AsyncGenerator
+from hashlib import blake2b
 from typing import TypeVar
 
 from src.agent.agent_types.agent_types import Message
@@ -13,6 +15,29 @@ from src.prompts import get_step_prompt
 
 T = TypeVar("T")
 
+# Role members resolved once at import time.
+_SYSTEM = MessageRole.SYSTEM
+_USER = MessageRole.USER
+_ASSISTANT = MessageRole.ASSISTANT
+
+# Plain role strings so the per-message comparison is a str compare.
+_SYSTEM_ROLE = _SYSTEM.value
+_USER_ROLE = _USER.value
+
+
+def _response_key(prompt: str, input_data: str) -> bytes:
+    """Build a compact cache key for a request.
+
+    Args:
+        prompt: Prompt of the current step.
+        input_data: Input being processed.
+
+    Returns:
+        Digest of the prompt and the input.
+
+    """
+    return blake2b(f"{prompt}\0{input_data}".encode(), digest_size=16).digest()
+
 
 class SolverAgent(BaseAgent[str, str]):
     """Agent that solves programming problems."""
@@ -34,6 +59,7 @@ class SolverAgent(BaseAgent[str, str]):
         super().__init__(config)
         self._provider = provider
         self._state_manager = state_manager
+        self._response_cache: OrderedDict[bytes, str] = OrderedDict()
 
     def _prepare_messages(self, messages: list[Message]) -> list[Message]:
         """Prepare messages for provider.
@@ -48,15 +74,64 @@ class SolverAgent(BaseAgent[str, str]):
             Prepared messages.
 
         """
-        prepared_messages = []
-        for msg in messages:
-            if msg.role == MessageRole.SYSTEM:
-                prepared_messages.append(
-                    Message(role=MessageRole.USER, content=msg.content),
-                )
-            else:
-                prepared_messages.append(msg)
-        return prepared_messages
+        return [
+            Message(role=_USER_ROLE, content=msg.content)
+            if msg.role == _SYSTEM_ROLE
+            else msg
+            for msg in messages
+        ]
+
+    def clear_cache(self) -> None:
+        """Drop all cached responses."""
+        self._response_cache.clear()
+
+    def _generate(self, messages: list[Message], prompt: str, input_data: str) -> str:
+        """Generate a response, reusing cached responses when enabled.
+
+        With ``config.response_cache_size`` set, responses are kept in an LRU
+        cache keyed on the step prompt and the input, so the same input at
+        the same step is answered without calling the provider again, however
+        long the conversation has grown.
+
+        Args:
+            messages: Prepared messages.
+            prompt: Prompt of the current step.
+            input_data: Input being processed.
+
+        Returns:
+            Generated response.
+
+        """
+        cache_size = self.config.response_cache_size
+        if not cache_size:
+            return self._provider.generate(messages)
+
+        key = _response_key(prompt, input_data)
+        cache = self._response_cache
+        response = cache.get(key)
+        if response is not None:
+            cache.move_to_end(key)
+            return response
+
+        response = self._provider.generate(messages)
+        cache[key] = response
+        if len(cache) > cache_size:
+            cache.popitem(last=False)
+        return response
+
+    def _validate_input(self, input_data: str) -> None:
+        """Validate input before any processing.
+
+        Args:
+            input_data: Input data to process.
+
+        Raises:
+            ValueError: If input is empty or only whitespace.
+
+        """
+        if not input_data or input_data.isspace():
+            msg = "Input must not be empty"
+            raise ValueError(msg)
 
     def _validate_provider(self) -> None:
         """Validate provider is initialized.
@@ -69,27 +144,27 @@ class SolverAgent(BaseAgent[str, str]):
             msg = "Provider not initialized"
             raise ValueError(msg)
 
-    def _prepare_state(self, input_data: str) -> list[Message]:
+    def _prepare_state(self, input_data: str) -> tuple[str, list[Message]]:
         """Prepare agent state for processing.
 
         Args:
             input_data: Input data to process.
 
         Returns:
-            List of prepared messages.
+            Prompt of the current step and the prepared messages.
 
         """
         # Add user message
-        self.state.add_message(Message(role=MessageRole.USER, content=input_data))
+        self.state.add_message(Message(role=_USER, content=input_data))
 
         # Get prompt for current step
         prompt = get_step_prompt(self.state)
 
         # Add system message
-        self.state.add_message(Message(role=MessageRole.SYSTEM, content=prompt))
+        self.state.add_message(Message(role=_SYSTEM, content=prompt))
 
         # Prepare messages for provider
-        return self._prepare_messages(self.state.messages)
+        return prompt, self._prepare_messages(self.state.messages)
 
     def process(self, input_data: str) -> str:
         """Process input data.
@@ -101,14 +176,15 @@ class SolverAgent(BaseAgent[str, str]):
             Processed output.
 
         Raises:
-            ValueError: If provider is not initialized.
+            ValueError: If input is empty or provider is not initialized.
 
         """
+        self._validate_input(input_data)
         self._validate_provider()
-        messages = self._prepare_state(input_data)
+        prompt, messages = self._prepare_state(input_data)
 
-        response = self._provider.generate(messages)
-        self.state.add_message(Message(role=MessageRole.ASSISTANT, content=response))
+        response = self._generate(messages, prompt, input_data)
+        self.state.add_message(Message(role=_ASSISTANT, content=response))
 
         return response
 
@@ -122,11 +198,16 @@ class SolverAgent(BaseAgent[str, str]):
             Processed output chunks.
 
         Raises:
-            ValueError: If provider is not initialized.
+            ValueError: If input is empty or provider is not initialized.
 
         """
+        self._validate_input(input_data)
         self._validate_provider()
-        messages = self._prepare_state(input_data)
+        _, messages = self._prepare_state(input_data)
 
+        chunks: list[str] = []
         async for chunk in self._provider.generate_stream(messages):
+            chunks.append(chunk)
             yield chunk
+
+        self.state.add_message(Message(role=_ASSISTANT, content="".join(chunks)))
@@ -1,24 +1,56 @@
 """Agent state module."""
 
-from dataclasses import dataclass, field
+import json
+from collections import deque
+from collections.abc import Iterable, Mapping
+from dataclasses import fields, is_dataclass
 from typing import Any, Protocol, TypeVar
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from src.agent.agent_types.agent_types import Message
+from src.agent.agent_types.enums import AgentStatus
 from src.common_types.enums import AgentStep
-from src.messages import (
-    get_message_at_index,
-    get_metadata_at_index,
-    set_metadata_at_index,
-)
 
 T = TypeVar("T")
 
 
-@dataclass
-class Context:
-    """Agent context."""
+def _json_default(obj: object) -> object:
+    """Encode values the JSON encoders do not handle natively.
+
+    Args:
+        obj: Value to encode.
+
+    Returns:
+        JSON-serializable replacement.
+
+    Raises:
+        TypeError: If the value cannot be encoded.
+
+    Dataclasses are encoded one level at a time, so their field values go
+    through the encoder (and this hook) again.
+
+    """
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return {f.name: getattr(obj, f.name) for f in fields(obj)}
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    msg = f"Object of type {type(obj).__name__} is not JSON serializable"
+    raise TypeError(msg)
+
 
-    data: dict[str, Any] = field(default_factory=dict)
+if orjson is not None:
+
+    def _dumps(obj: object) -> bytes:
+        return orjson.dumps(obj, default=_json_default, option=orjson.OPT_NON_STR_KEYS)
+
+else:
+
+    def _dumps(obj: object) -> bytes:
+        return json.dumps(obj, default=_json_default).encode()
 
 
 class StateManager(Protocol):
@@ -47,7 +79,6 @@ class StateManager(Protocol):
         ...
 
 
-@dataclass
 class AgentState:
     """Agent state.
 
@@ -55,13 +86,37 @@ class AgentState:
     context, execution results, and step tracking.
     """
 
-    messages: list[Message] = field(default_factory=list)
-    context: Context = field(default_factory=Context)
-    execution_result: str = ""
-    current_step: AgentStep = field(default=AgentStep.UNDERSTAND)
-    step_count: int = field(default=0)
-    task_completed: bool = field(default=False)
-    error: str | None = field(default=None)
+    __slots__ = (
+        "context",
+        "current_step",
+        "error_msg",
+        "error_type",
+        "execution_result",
+        "messages",
+        "retry_count",
+        "status",
+        "step_count",
+        "task_completed",
+    )
+
+    def __init__(self, max_messages: int | None = None) -> None:
+        """Initialize empty state.
+
+        Args:
+            max_messages: Optional message history limit. When set, adding a
+                message beyond the limit evicts the oldest one.
+
+        """
+        self.messages: deque[Message] = deque(maxlen=max_messages)
+        self.context: dict[str, Any] = {}
+        self.execution_result = ""
+        self.current_step = AgentStep.UNDERSTAND
+        self.step_count = 0
+        self.task_completed = False
+        self.error_type: str | None = None
+        self.error_msg: str | None = None
+        self.status = AgentStatus.IDLE
+        self.retry_count = 0
 
     def add_message(self, message: Message) -> None:
         """Add message to state.
@@ -72,6 +127,15 @@ class AgentState:
         """
         self.messages.append(message)
 
+    def extend_messages(self, messages: Iterable[Message]) -> None:
+        """Add several messages to state in one call.
+
+        Args:
+            messages: Messages to add, in order.
+
+        """
+        self.messages.extend(messages)
+
     def get_message(self, index: int) -> Message:
         """Get message at index.
 
@@ -85,7 +149,7 @@ class AgentState:
             IndexError: If index is out of range.
 
         """
-        return get_message_at_index(self.messages, index)
+        return self.messages[index]
 
     def get_message_metadata(
         self,
@@ -104,7 +168,7 @@ class AgentState:
             Message metadata value.
 
         """
-        return get_metadata_at_index(self.messages, index, key, default)
+        return self.messages[index].metadata.get(key, default)
 
     def set_message_metadata(
         self,
@@ -120,7 +184,20 @@ class AgentState:
             value: Metadata value.
 
         """
-        set_metadata_at_index(self.messages, index, key, value)
+        self.messages[index].metadata[key] = value
+
+    def record_error(self, err: BaseException) -> None:
+        """Record an error by type name and message.
+
+        Only strings are kept, so the exception and its traceback are not
+        held alive by the state.
+
+        Args:
+            err: Error to record.
+
+        """
+        self.error_type = type(err).__name__
+        self.error_msg = str(err)
 
     def get_context(self, key: str, default: T | None = None) -> T | None:
         """Get context value.
@@ -133,7 +210,7 @@ class AgentState:
             Context value.
 
         """
-        return self.context.data.get(key, default)
+        return self.context.get(key, default)
 
     def set_context(self, key: str, value: T) -> None:
         """Set context value.
@@ -143,21 +220,68 @@ class AgentState:
             value: Context value.
 
         """
-        self.context.data[key] = value
+        self.context[key] = value
 
-    def clear(self) -> None:
-        """Clear state."""
-        self.messages.clear()
-        self.context.data.clear()
-        self.execution_result = ""
-        self.step_count = 0
-        self.task_completed = False
-        self.error = None
-        self.current_step = AgentStep.UNDERSTAND
+    def update(self, **kwargs: object) -> None:
+        """Update state fields.
+
+        Keys that are not state fields are ignored.
+
+        Args:
+            **kwargs: Field values keyed by field name.
+
+        """
+        for key, value in kwargs.items():
+            if key in _STATE_FIELDS:
+                setattr(self, key, value)
+
+    def to_bytes(self) -> bytes:
+        """Serialize a snapshot of the state to JSON.
+
+        Uses ``orjson`` when it is installed and falls back to the standard
+        library encoder otherwise.
+
+        Returns:
+            UTF-8 encoded JSON document.
 
+        Raises:
+            TypeError: If the context holds a value that cannot be encoded.
+
+        """
+        snapshot = {field: getattr(self, field) for field in self.__slots__}
+        snapshot["messages"] = list(self.messages)
+        return _dumps(snapshot)
+
+    def clear(self, *, keep_aliases: bool = False) -> None:
+        """Clear state.
+
+        By default the initializer is re-run, so fresh message and context
+        containers are swapped in and the old ones are released as a whole.
+        The message history limit is kept.
+
+        Args:
+            keep_aliases: Empty the existing message and context containers in
+                place instead, for callers that hold references to them.
 
-class InMemoryStateManager(StateManager):
-    """In-memory state manager."""
+        """
+        messages = self.messages
+        context = self.context
+        AgentState.__init__(self, messages.maxlen)
+        if keep_aliases:
+            messages.clear()
+            context.clear()
+            self.messages = messages
+            self.context = context
+
+
+_STATE_FIELDS = frozenset(AgentState.__slots__)
+
+
+class InMemoryStateManager:
+    """In-memory state manager.
+
+    Satisfies ``StateManager`` structurally.
+    """
 
     def __init__(self) -> None:
         """Initialize manager."""
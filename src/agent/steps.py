@@ -1,14 +1,87 @@
 """Agent step processing module."""
 
-from abc import abstractmethod
-from dataclasses import dataclass
-from typing import Protocol, TypeVar, runtime_checkable
+import inspect
+from abc import ABC, abstractmethod
+from collections.abc import Iterator, Mapping
+from collections.abc import Set as AbstractSet
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Generic, Protocol, TypeVar, runtime_checkable
+
+import anyio
+
+from src.config.constants import (
+    DEFAULT_MAX_RETRIES,
+    DEFAULT_MAX_RETRY_DELAY,
+    DEFAULT_RETRY_DELAY,
+)
 
 from .agent_types import StepKwargs, StepResult
-from .state.base import AgentState, AgentStatus
+from .agent_types.enums import AgentStatus
+from .state.base import AgentState
 
 T = TypeVar("T")
 
+# Status members resolved once at import time.
+_PROCESSING = AgentStatus.PROCESSING
+_DONE = AgentStatus.DONE
+_ERROR = AgentStatus.ERROR
+
+_current_state: ContextVar[AgentState] = ContextVar("agent_state")
+
+
+def get_current_state() -> AgentState:
+    """Get the state of the step currently being executed.
+
+    Helpers called from a step function can use this instead of having the
+    state passed down to them. The value follows ``await`` and is isolated
+    per task.
+
+    Returns:
+        Current agent state.
+
+    Raises:
+        LookupError: If no step is being executed.
+
+    """
+    return _current_state.get()
+
+
+@contextmanager
+def _active_state(state: AgentState) -> Iterator[None]:
+    """Make a state current for the duration of a step.
+
+    Args:
+        state: State to make current.
+
+    Yields:
+        None.
+
+    """
+    token = _current_state.set(state)
+    try:
+        yield
+    finally:
+        _current_state.reset(token)
+
+
+def _backoff_schedule(retry_delay: float, max_retry_delay: float) -> tuple[float, ...]:
+    """Build the exponential backoff delays up to the first capped one.
+
+    Args:
+        retry_delay: Delay before the first retry, in seconds.
+        max_retry_delay: Upper bound for the delay, in seconds.
+
+    Returns:
+        Delays in seconds; later retries reuse the last entry.
+
+    """
+    schedule = [min(retry_delay, max_retry_delay)]
+    while 0 < schedule[-1] < max_retry_delay:
+        schedule.append(min(schedule[-1] * 2, max_retry_delay))
+    return tuple(schedule)
+
 
 @runtime_checkable
 class StepFunction(Protocol):
@@ -28,7 +101,7 @@ class StepFunction(Protocol):
         ...
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Step:
     """Agent execution step."""
 
@@ -38,6 +111,50 @@ class Step:
     optional_keys: list[str] = None
     retry_on_error: bool = True
     max_retries: int | None = None
+    _required_set: frozenset[str] = field(init=False, repr=False, compare=False)
+    _input_keys: tuple[str, ...] = field(init=False, repr=False, compare=False)
+    effective_max_retries: int | None = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Cache required keys, declared inputs and the retry limit."""
+        object.__setattr__(self, "_required_set", frozenset(self.required_keys))
+        object.__setattr__(
+            self,
+            "_input_keys",
+            (*self.required_keys, *(self.optional_keys or ())),
+        )
+        object.__setattr__(
+            self,
+            "effective_max_retries",
+            self.max_retries if self.retry_on_error else 0,
+        )
+
+    def has_inputs(self, keys: AbstractSet[str]) -> bool:
+        """Check whether all required keys are available.
+
+        Args:
+            keys: Available input keys.
+
+        Returns:
+            True if the step can run with the given keys.
+
+        """
+        return self._required_set <= keys
+
+    def select_inputs(
+        self,
+        available: Mapping[str, StepKwargs],
+    ) -> dict[str, StepKwargs]:
+        """Pick the required and optional inputs of this step.
+
+        Args:
+            available: Available inputs keyed by name.
+
+        Returns:
+            The declared inputs that are available.
+
+        """
+        return {key: available[key] for key in self._input_keys if key in available}
 
     def validate_inputs(self, **kwargs: StepKwargs) -> None:
         """Validate step inputs.
@@ -49,17 +166,16 @@ class Step:
             ValueError: If required keys are missing.
 
         """
-        error_msg: str
+        if not self._required_set or self._required_set.issubset(kwargs):
+            return
         missing_keys = [key for key in self.required_keys if key not in kwargs]
-        if missing_keys:
-            error_msg = f"Missing required keys: {', '.join(missing_keys)}"
-            raise ValueError(error_msg)
+        error_msg = f"Missing required keys: {', '.join(missing_keys)}"
+        raise ValueError(error_msg)
 
 
 class StepExecutor(Protocol[T]):
     """Step executor protocol."""
 
-    @abstractmethod
     def execute(self, step: Step) -> StepResult[T]:
         """Execute a step.
 
@@ -85,15 +201,51 @@ def _handle_step_success(state: AgentState, result: StepResult) -> StepResult:
 
     """
     state.retry_count = 0
-    state.status = AgentStatus.COMPLETED
+    state.status = _DONE
     return result
 
 
-class BaseStepExecutor(StepExecutor[T]):
-    """Base step executor."""
+def _handle_step_failure(state: AgentState, step: "Step", err: Exception) -> None:
+    """Handle a step that failed and will not be retried.
 
-    def __init__(self) -> None:
-        """Initialize executor."""
+    Args:
+        state: Current agent state.
+        step: Step that failed.
+        err: Error raised by the step.
+
+    Raises:
+        RuntimeError: Always, chained from the step error.
+
+    """
+    state.status = _ERROR
+    error_msg = f"Step '{step.name}' failed: {err}"
+    raise RuntimeError(error_msg) from err
+
+
+class BaseStepExecutor(ABC, Generic[T]):
+    """Base step executor.
+
+    Satisfies ``StepExecutor`` structurally.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        retry_delay: float = DEFAULT_RETRY_DELAY,
+        max_retry_delay: float = DEFAULT_MAX_RETRY_DELAY,
+    ) -> None:
+        """Initialize executor.
+
+        Args:
+            max_retries: Retries for steps that do not set their own limit.
+            retry_delay: Initial delay between async retries, in seconds.
+            max_retry_delay: Upper bound for the async retry delay, in seconds.
+
+        """
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.max_retry_delay = max_retry_delay
+        self._backoff = _backoff_schedule(retry_delay, max_retry_delay)
         self.steps: list[Step] = []
         self.current_step: Step | None = None
         self.last_result: StepResult[T] | None = None
@@ -109,7 +261,7 @@ class BaseStepExecutor(StepExecutor[T]):
 
     def clear_steps(self) -> None:
         """Clear all steps."""
-        self.steps.clear()
+        self.steps = []
         self.current_step = None
         self.last_result = None
 
@@ -141,13 +293,39 @@ class BaseStepExecutor(StepExecutor[T]):
         """
         ...
 
+    def _max_retries(self, step: Step) -> int:
+        """Resolve the retry limit for a step.
+
+        Args:
+            step: Step to execute.
+
+        Returns:
+            Maximum number of retries, zero if the step is not retried.
+
+        """
+        max_retries = step.effective_max_retries
+        return self.max_retries if max_retries is None else max_retries
+
+    def _retry_delay(self, attempt: int) -> float:
+        """Get the exponential backoff delay before a retry.
+
+        Args:
+            attempt: Number of failed attempts so far, starting at 1.
+
+        Returns:
+            Delay in seconds.
+
+        """
+        backoff = self._backoff
+        return backoff[min(attempt, len(backoff)) - 1]
+
     def execute_step(
         self,
         step: Step,
         state: AgentState,
         **kwargs: StepKwargs,
     ) -> StepResult:
-        """Execute a single step.
+        """Execute a single step, retrying on failure.
 
         Args:
             step: Step to execute.
@@ -161,35 +339,144 @@ class BaseStepExecutor(StepExecutor[T]):
             RuntimeError: If step execution fails.
 
         """
-        error_msg: str
+        step.validate_inputs(**kwargs)
+        max_retries = self._max_retries(step)
+        attempt = 0
+
+        with _active_state(state):
+            while True:
+                state.status = _PROCESSING
+                state.step_count += 1
+                try:
+                    result = step.func(state, **kwargs)
+                except Exception as err:
+                    state.record_error(err)
+                    state.retry_count += 1
+                    attempt += 1
+                    if attempt > max_retries:
+                        _handle_step_failure(state, step, err)
+                    continue
+                return _handle_step_success(state, result)
+
+    async def aexecute_step(
+        self,
+        step: Step,
+        state: AgentState,
+        **kwargs: StepKwargs,
+    ) -> StepResult:
+        """Execute a single step asynchronously, retrying with backoff.
+
+        The step function may be synchronous or return an awaitable. Between
+        attempts the executor awaits an exponential backoff delay, so other
+        tasks keep running on the event loop.
+
+        Args:
+            step: Step to execute.
+            state: Current agent state.
+            **kwargs: Additional arguments.
 
-        # Validate inputs
+        Returns:
+            Step result.
+
+        Raises:
+            RuntimeError: If step execution fails.
+
+        """
         step.validate_inputs(**kwargs)
+        max_retries = self._max_retries(step)
+        attempt = 0
+
+        with _active_state(state):
+            while True:
+                state.status = _PROCESSING
+                state.step_count += 1
+                try:
+                    result = step.func(state, **kwargs)
+                    if inspect.isawaitable(result):
+                        result = await result
+                except Exception as err:
+                    state.record_error(err)
+                    state.retry_count += 1
+                    attempt += 1
+                    if attempt > max_retries:
+                        _handle_step_failure(state, step, err)
+                    await anyio.sleep(self._retry_delay(attempt))
+                    continue
+                return _handle_step_success(state, result)
+
+    async def execute_batch(
+        self,
+        steps: list[Step],
+        state: AgentState,
+        **kwargs: StepKwargs,
+    ) -> dict[str, StepResult]:
+        """Execute several steps concurrently.
+
+        Steps run in waves on a task group. A step starts as soon as all of
+        its required keys are available, either from ``kwargs`` or as the name
+        of a step that has already finished. Results of finished steps are
+        passed to later steps as keyword arguments under the step name. Each
+        step only receives the required and optional keys it declares.
 
-        # Update state
-        state.status = AgentStatus.RUNNING
-        state.step_count += 1
-
-        try:
-            # Execute step
-            result = step.func(state, **kwargs)
-            return _handle_step_success(state, result)
-
-        except Exception as err:
-            state.error = err
-            state.retry_count += 1
-
-            # Handle retries
-            if step.retry_on_error:
-                max_retries = (
-                    step.max_retries
-                    if step.max_retries is not None
-                    else state.config.max_retries
-                )
-                if state.retry_count <= max_retries:
-                    return self.execute_step(step, state, **kwargs)
-
-            # Update state on failure
-            state.status = AgentStatus.FAILED
-            error_msg = f"Step '{step.name}' failed: {err}"
-            raise RuntimeError(error_msg) from err
+        Args:
+            steps: Steps to execute.
+            state: Current agent state, shared by all steps.
+            **kwargs: Additional arguments passed to every step.
+
+        Returns:
+            Step results keyed by step name.
+
+        Raises:
+            ValueError: If two steps share a name, or a step's required keys
+                can never be satisfied.
+            ExceptionGroup: If any step fails, wrapping each step's
+                ``RuntimeError``.
+
+        """
+        if len({step.name for step in steps}) != len(steps):
+            msg = "Step names in a batch must be unique"
+            raise ValueError(msg)
+
+        results: dict[str, StepResult] = {}
+        pending = list(steps)
+
+        while pending:
+            available = kwargs.keys() | results.keys()
+            ready: list[Step] = []
+            waiting: list[Step] = []
+            for step in pending:
+                (ready if step.has_inputs(available) else waiting).append(step)
+            if not ready:
+                waiting[0].validate_inputs(**{**kwargs, **results})
+
+            step_kwargs = {**kwargs, **results}
+            async with anyio.create_task_group() as task_group:
+                for step in ready:
+                    task_group.start_soon(
+                        self._execute_into,
+                        results,
+                        step,
+                        state,
+                        step.select_inputs(step_kwargs),
+                    )
+            pending = waiting
+
+        return results
+
+    async def _execute_into(
+        self,
+        results: dict[str, StepResult],
+        step: Step,
+        state: AgentState,
+        kwargs: dict[str, StepKwargs],
+    ) -> None:
+        """Execute a step and store its result.
+
+        Args:
+            results: Mapping the result is stored in, under the step name.
+            step: Step to execute.
+            state: Current agent state.
+            kwargs: Arguments for the step.
+
+        """
+        results[step.name] = await self.aexecute_step(step, state, **kwargs)
@@ -2,18 +2,24 @@
 
 import logging
 import sys
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import click
 
-from src.agent.solver import SolverAgent
-from src.agent.state.base import InMemoryStateManager
 from src.config import AgentConfig
 from src.config.utils import load_env_var
-from src.llm_providers.config.provider_config import GeminiConfig
-from src.llm_providers.providers.gemini import GeminiProvider
 from src.utils.log_utils import setup_logging
 
+if TYPE_CHECKING:
+    from src.agent.solver import SolverAgent
+    from src.llm_providers.providers.gemini import GeminiProvider
+
+# The agent and provider stacks (langchain, google-generativeai) and asyncio are
+# imported inside the commands that use them, so --help and other commands
+# start fast.
+
 logger = logging.getLogger(__name__)
 
 # Constants
@@ -23,6 +29,7 @@ DEFAULT_MODEL = (
 )
 DEFAULT_TEMPERATURE = 0.7
 DEFAULT_MAX_TOKENS = 1000
+DEFAULT_CONCURRENCY = 8
 
 # Error messages
 TASK_ERROR = "Error processing task"
@@ -75,13 +82,26 @@ def cli() -> None:
     type=int,
     help="Maximum tokens to generate.",
 )
+@click.option(
+    "--stream",
+    "-s",
+    is_flag=True,
+    help="Print the response as it is generated.",
+)
 def solve(
     task: str,
     model: str = DEFAULT_MODEL,
     temperature: float = DEFAULT_TEMPERATURE,
     max_tokens: int = DEFAULT_MAX_TOKENS,
+    *,
+    stream: bool = False,
 ) -> None:
     """Solve a programming task."""
+    import asyncio
+
+    from src.agent.solver import SolverAgent
+    from src.agent.state.base import InMemoryStateManager
+
     try:
         # Create configuration
         config = AgentConfig(
@@ -91,15 +111,7 @@ def solve(
         )
 
         # Create provider
-        try:
-            api_key = load_env_var("GEMINI_API_KEY")
-            provider_config = GeminiConfig(api_key=api_key)
-            provider = GeminiProvider(config=provider_config)
-        except ValueError as e:
-            if "API key" in str(e):
-                click.echo(API_KEY_ERROR, err=True)
-                sys.exit(1)
-            raise
+        provider = _create_provider(model, temperature, max_tokens)
 
         # Create state manager
         state_manager = InMemoryStateManager()
@@ -112,14 +124,219 @@ def solve(
         )
 
         # Process task
-        result = agent.process(task)
-        click.echo(result)
+        if stream:
+            asyncio.run(_echo_stream(agent, task))
+        else:
+            click.echo(agent.process(task))
 
     except Exception:
         logger.exception(TASK_ERROR)
         sys.exit(1)
 
 
+@cli.command("solve-batch")
+@click.argument(
+    "file",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+)
+@click.option(
+    "--model",
+    default=DEFAULT_MODEL,
+    help="Model to use for generation.",
+)
+@click.option(
+    "--temperature",
+    default=DEFAULT_TEMPERATURE,
+    type=float,
+    help="Temperature for generation.",
+)
+@click.option(
+    "--max-tokens",
+    default=DEFAULT_MAX_TOKENS,
+    type=int,
+    help="Maximum tokens to generate.",
+)
+@click.option(
+    "--concurrency",
+    default=DEFAULT_CONCURRENCY,
+    type=click.IntRange(min=1),
+    help="Maximum number of tasks solved at once.",
+)
+def solve_batch(
+    file: Path,
+    model: str = DEFAULT_MODEL,
+    temperature: float = DEFAULT_TEMPERATURE,
+    max_tokens: int = DEFAULT_MAX_TOKENS,
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> None:
+    """Solve the programming tasks in FILE, one task per line."""
+    import asyncio
+
+    tasks = [
+        line.strip()
+        for line in file.read_text(encoding="utf-8").splitlines()
+        if line.strip()
+    ]
+
+    try:
+        config = AgentConfig(
+            model=model,
+            temperature=temperature,
+            max_tokens=max_tokens,
+        )
+        provider = _create_provider(model, temperature, max_tokens)
+        results = asyncio.run(_solve_all(tasks, provider, config, concurrency))
+    except Exception:
+        logger.exception(TASK_ERROR)
+        sys.exit(1)
+
+    failed = False
+    for task, result in zip(tasks, results, strict=True):
+        click.echo(f"# {task}")
+        if isinstance(result, BaseException):
+            failed = True
+            click.echo(f"{TASK_ERROR}: {result}", err=True)
+        else:
+            click.echo(result)
+        click.echo()
+
+    if failed:
+        sys.exit(1)
+
+
+@lru_cache(maxsize=8)
+def _shared_provider(
+    api_key: str,
+    model: str,
+    temperature: float,
+    max_tokens: int,
+) -> "GeminiProvider":
+    """Get a Gemini provider for a configuration.
+
+    A provider and its client are created once per API key and generation
+    settings and then shared by every agent in the process that uses them.
+
+    Args:
+        api_key: Gemini API key.
+        model: Model to use for generation.
+        temperature: Temperature for generation.
+        max_tokens: Maximum tokens to generate.
+
+    Returns:
+        Configured provider.
+
+    """
+    from src.llm_providers.config.provider_config import GeminiConfig
+    from src.llm_providers.providers.gemini import GeminiProvider
+
+    return GeminiProvider(
+        config=GeminiConfig(
+            api_key=api_key,
+            model=model,
+            temperature=temperature,
+            max_output_tokens=max_tokens,
+        ),
+    )
+
+
+def _load_provider(
+    model: str = DEFAULT_MODEL,
+    temperature: float = DEFAULT_TEMPERATURE,
+    max_tokens: int = DEFAULT_MAX_TOKENS,
+) -> "GeminiProvider":
+    """Get the shared provider for the API key in .env and the given settings.
+
+    The key is read on every call, so a changed key gets a new provider.
+
+    Args:
+        model: Model to use for generation.
+        temperature: Temperature for generation.
+        max_tokens: Maximum tokens to generate.
+
+    Returns:
+        Configured provider.
+
+    """
+    api_key = load_env_var("GEMINI_API_KEY")
+    return _shared_provider(api_key, model, temperature, max_tokens)
+
+
+def _create_provider(
+    model: str = DEFAULT_MODEL,
+    temperature: float = DEFAULT_TEMPERATURE,
+    max_tokens: int = DEFAULT_MAX_TOKENS,
+) -> "GeminiProvider":
+    """Get the shared provider, exiting with setup help if the key is missing.
+
+    Args:
+        model: Model to use for generation.
+        temperature: Temperature for generation.
+        max_tokens: Maximum tokens to generate.
+
+    Returns:
+        Configured provider.
+
+    """
+    try:
+        return _load_provider(model, temperature, max_tokens)
+    except ValueError as e:
+        if "API key" in str(e):
+            click.echo(API_KEY_ERROR, err=True)
+            sys.exit(1)
+        raise
+
+
+async def _solve_all(
+    tasks: list[str],
+    provider: "GeminiProvider",
+    config: AgentConfig,
+    concurrency: int,
+) -> list[str | BaseException]:
+    """Solve tasks concurrently on one event loop.
+
+    Each task gets its own agent, so conversations do not mix, while all of
+    them share the provider and its client.
+
+    Args:
+        tasks: Tasks to solve.
+        provider: Provider shared by all agents.
+        config: Agent configuration.
+        concurrency: Maximum number of tasks in flight.
+
+    Returns:
+        Response or raised error for each task, in task order.
+
+    """
+    import asyncio
+
+    from src.agent.solver import SolverAgent
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def solve_one(task: str) -> str:
+        async with semaphore:
+            agent = SolverAgent(provider=provider, config=config)
+            return "".join([chunk async for chunk in agent.process_stream(task)])
+
+    return await asyncio.gather(
+        *(solve_one(task) for task in tasks),
+        return_exceptions=True,
+    )
+
+
+async def _echo_stream(agent: "SolverAgent", task: str) -> None:
+    """Echo response chunks as the agent produces them.
+
+    Args:
+        agent: Agent to run.
+        task: Task to solve.
+
+    """
+    async for chunk in agent.process_stream(task):
+        click.echo(chunk, nl=False)
+    click.echo()
+
+
 def process_message(message: str) -> str:
     """Process a message using the solver agent.
 
@@ -133,11 +350,10 @@ def process_message(message: str) -> str:
         TaskError: If an error occurs during processing.
 
     """
+    from src.agent.solver import SolverAgent
+
     try:
-        api_key = load_env_var("GEMINI_API_KEY")
-        provider_config = GeminiConfig(api_key=api_key)
-        provider = GeminiProvider(config=provider_config)
-        agent = SolverAgent(provider=provider)
+        agent = SolverAgent(provider=_load_provider())
         return agent.process(message)
     except Exception as err:
         logger.exception(MESSAGE_ERROR)
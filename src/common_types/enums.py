@@ -1,9 +1,10 @@
 """Common enumerations used throughout the application."""
 
-from enum import Enum
+import sys
+from enum import Enum, IntEnum
 
 
-class AgentStep(str, Enum):
+class AgentStep(IntEnum):
     """Agent execution steps.
 
     These steps represent the core problem-solving workflow:
@@ -11,12 +12,39 @@ class AgentStep(str, Enum):
     - PLAN: Create a strategy to solve the task
     - EXECUTE: Implement the planned solution
     - VERIFY: Test and validate the solution
+
+    Steps are integers so comparisons and dict lookups avoid string hashing;
+    use ``label`` where a string name is needed.
     """
 
-    UNDERSTAND = "understand"
-    PLAN = "plan"
-    EXECUTE = "execute"
-    VERIFY = "verify"
+    UNDERSTAND = 0
+    PLAN = 1
+    EXECUTE = 2
+    VERIFY = 3
+
+    @property
+    def label(self) -> str:
+        """Get the lowercase step name."""
+        return _AGENT_STEP_LABELS[self]
+
+    @classmethod
+    def from_label(cls, label: str) -> "AgentStep":
+        """Get a step from its lowercase name.
+
+        Args:
+            label: Step name, e.g. ``"plan"``.
+
+        Returns:
+            Matching step.
+
+        Raises:
+            KeyError: If no step has this name.
+
+        """
+        return cls[label.upper()]
+
+
+_AGENT_STEP_LABELS = {step: sys.intern(step.name.lower()) for step in AgentStep}
 
 
 class MessageRole(str, Enum):
@@ -10,8 +10,10 @@ from .base import BaseConfig
 from .constants import (
     DEFAULT_MAX_OUTPUT_TOKENS,
     DEFAULT_MAX_RETRIES,
+    DEFAULT_MAX_RETRY_DELAY,
     DEFAULT_MAX_STEPS,
     DEFAULT_MODEL,
+    DEFAULT_RETRY_DELAY,
     DEFAULT_TASK_TIMEOUT,
     DEFAULT_TEMPERATURE,
     DEFAULT_TOP_K,
@@ -23,8 +25,10 @@ from .llm import LLMConfig
 __all__ = [
     "DEFAULT_MAX_OUTPUT_TOKENS",
     "DEFAULT_MAX_RETRIES",
+    "DEFAULT_MAX_RETRY_DELAY",
     "DEFAULT_MAX_STEPS",
     "DEFAULT_MODEL",
+    "DEFAULT_RETRY_DELAY",
     "DEFAULT_TASK_TIMEOUT",
     "DEFAULT_TEMPERATURE",
     "DEFAULT_TOP_K",
@@ -21,7 +21,25 @@ class NumericValidation(Enum):
     DISALLOW_ZERO = auto()
 
 
-@dataclass
+# Numeric fields checked by AgentConfig.validate:
+# (name, min value, max value, zero handling).
+_NUMERIC_FIELDS: tuple[
+    tuple[str, float | None, float | None, NumericValidation],
+    ...,
+] = (
+    ("task_timeout", 1, None, NumericValidation.DISALLOW_ZERO),
+    ("max_retries", 0, None, NumericValidation.ALLOW_ZERO),
+    ("max_steps", 1, None, NumericValidation.DISALLOW_ZERO),
+    ("max_messages", 1, None, NumericValidation.DISALLOW_ZERO),
+    ("response_cache_size", 0, None, NumericValidation.ALLOW_ZERO),
+    ("temperature", 0, 1, NumericValidation.DISALLOW_ZERO),
+)
+
+# Numeric fields that may be None to mean "no limit".
+_OPTIONAL_NUMERIC_FIELDS = frozenset({"max_messages"})
+
+
+@dataclass(slots=True)
 class AgentConfig(BaseConfig):
     """Agent configuration.
 
@@ -40,73 +58,73 @@ class AgentConfig(BaseConfig):
     context: dict[str, Any] | None = field(default_factory=dict)
     task_timeout: int = DEFAULT_TASK_TIMEOUT
     max_steps: int = DEFAULT_MAX_STEPS
+    max_messages: int | None = None
+    response_cache_size: int = 0
     name: str | None = None
 
     def __post_init__(self) -> None:
-        """Validate configuration after initialization."""
-        self.validate()
-
-    def _validate_numeric_field(
-        self,
-        field_name: str,
-        value: float,
-        min_value: float | None = None,
-        max_value: float | None = None,
-        validation_type: NumericValidation = NumericValidation.DISALLOW_ZERO,
-    ) -> None:
-        """Validate a numeric field.
+        """Normalize and validate configuration after initialization.
 
-        Args:
-            field_name: Name of the field being validated.
-            value: Value to validate.
-            min_value: Minimum allowed value (inclusive).
-            max_value: Maximum allowed value (inclusive).
-            validation_type: Type of validation to perform.
+        A ``model`` given as a mapping becomes an ``LLMConfig`` here. An
+        ``LLMConfig`` validates itself when it is built, so it is not checked
+        a second time.
+        """
+        if isinstance(self.model, dict):
+            self.model = LLMConfig(**self.model)
+        self._validate_fields()
 
-        Raises:
-            ConfigError: If validation fails.
+    def update(self, other: dict[str, Any]) -> None:
+        """Update configuration with dictionary.
 
-        """
-        if min_value is not None and value < min_value:
-            msg = f"{field_name} must be greater than {min_value}"
-            raise ConfigError(msg)
+        A ``model`` mapping replacing a string model becomes an ``LLMConfig``,
+        as it does at initialization.
 
-        if max_value is not None and value > max_value:
-            msg = f"{field_name} must be less than {max_value}"
-            raise ConfigError(msg)
+        Args:
+            other: Dictionary with updates.
 
-        if validation_type == NumericValidation.DISALLOW_ZERO and value == 0:
-            msg = f"{field_name} must be non-zero"
-            raise ConfigError(msg)
+        """
+        model = other.get("model")
+        if isinstance(model, dict) and not isinstance(self.model, LLMConfig):
+            other = {**other, "model": LLMConfig(**model)}
+        BaseConfig.update(self, other)
 
     def validate(self) -> None:
-        """Validate configuration.
+        """Validate configuration, including a nested ``LLMConfig``.
+
+        Raises:
+            ConfigError: If configuration is invalid.
+
+        """
+        self._validate_fields()
+        if isinstance(self.model, LLMConfig):
+            self.model.validate()
+
+    def _validate_fields(self) -> None:
+        """Validate this configuration's own fields.
 
         Raises:
             ConfigError: If configuration is invalid.
 
         """
         # Validate numeric fields
-        self._validate_numeric_field("task_timeout", self.task_timeout, min_value=1)
-        self._validate_numeric_field(
-            "max_retries",
-            self.max_retries,
-            min_value=0,
-            validation_type=NumericValidation.ALLOW_ZERO,
-        )
-        self._validate_numeric_field("max_steps", self.max_steps, min_value=1)
-        self._validate_numeric_field(
-            "temperature",
-            self.temperature,
-            min_value=0,
-            max_value=1,
-        )
+        for field_name, min_value, max_value, validation_type in _NUMERIC_FIELDS:
+            value = getattr(self, field_name)
+            if value is None and field_name in _OPTIONAL_NUMERIC_FIELDS:
+                continue
+
+            if min_value is not None and value < min_value:
+                msg = f"{field_name} must be greater than {min_value}"
+                raise ConfigError(msg)
+
+            if max_value is not None and value > max_value:
+                msg = f"{field_name} must be less than {max_value}"
+                raise ConfigError(msg)
+
+            if validation_type is NumericValidation.DISALLOW_ZERO and value == 0:
+                msg = f"{field_name} must be non-zero"
+                raise ConfigError(msg)
 
         # Validate model
-        if isinstance(self.model, dict):
-            self.model = LLMConfig(**self.model)
-        elif isinstance(self.model, LLMConfig):
-            self.model.validate()
-        elif not isinstance(self.model, str):
+        if not isinstance(self.model, str | LLMConfig):
             msg = "Model must be a string or LLMConfig instance"
             raise ConfigError(msg)
@@ -1,10 +1,40 @@
 """Base configuration classes and utilities."""
 
-from dataclasses import dataclass
+from collections.abc import Mapping
+from dataclasses import dataclass, fields
+from functools import cache
 from typing import Any
 
 
-@dataclass
+@cache
+def _field_names(cls: type) -> tuple[str, ...]:
+    """Get the field names of a config class, computed once per class.
+
+    Args:
+        cls: Config dataclass.
+
+    Returns:
+        Field names in definition order.
+
+    """
+    return tuple(f.name for f in fields(cls))
+
+
+@cache
+def _init_field_names(cls: type) -> frozenset[str]:
+    """Get the names accepted by a config class's initializer.
+
+    Args:
+        cls: Config dataclass.
+
+    Returns:
+        Names of the fields set through ``__init__``.
+
+    """
+    return frozenset(f.name for f in fields(cls) if f.init)
+
+
+@dataclass(slots=True)
 class BaseConfig:
     """Base configuration class."""
 
@@ -15,15 +45,22 @@ class BaseConfig:
             Configuration as dictionary.
 
         """
-        return {
-            k: v.to_dict() if isinstance(v, BaseConfig) else v
-            for k, v in self.__dict__.items()
-        }
+        result = {}
+        for name in _field_names(type(self)):
+            value = getattr(self, name)
+            if isinstance(value, BaseConfig):
+                value = value.to_dict()
+            elif isinstance(value, Mapping):
+                value = dict(value)
+            result[name] = value
+        return result
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "BaseConfig":
         """Create configuration from dictionary.
 
+        Keys that are not configuration fields are ignored.
+
         Args:
             data: Configuration dictionary.
 
@@ -31,7 +68,8 @@ class BaseConfig:
             Configuration instance.
 
         """
-        return cls(**data)
+        names = _init_field_names(cls)
+        return cls(**{k: v for k, v in data.items() if k in names})
 
     def update(self, other: dict[str, Any]) -> None:
         """Update configuration with dictionary.
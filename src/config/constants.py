@@ -6,6 +6,8 @@ VERSION = "0.1.0"
 # Agent defaults
 DEFAULT_TASK_TIMEOUT = 300  # 5 minutes
 DEFAULT_MAX_RETRIES = 3
+DEFAULT_RETRY_DELAY = 1.0  # seconds, doubled after each failed attempt
+DEFAULT_MAX_RETRY_DELAY = 30.0  # seconds
 DEFAULT_MAX_STEPS = 10
 
 # LLM defaults
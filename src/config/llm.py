@@ -1,6 +1,6 @@
 """LLM provider configuration."""
 
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field, fields
 from typing import Any
 
 from .base import BaseConfig
@@ -13,7 +13,7 @@ from .constants import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class LLMConfig(BaseConfig):
     """LLM provider configuration."""
 
@@ -60,10 +60,17 @@ class LLMConfig(BaseConfig):
     def dict(self) -> dict[str, Any]:
         """Convert configuration to dictionary.
 
+        Field values are copied shallowly; ``extra_params`` is copied and its
+        entries are also merged into the top level.
+
         Returns:
             Dictionary representation.
 
         """
-        config_dict = asdict(self)
+        config_dict = {name: getattr(self, name) for name in _LLM_CONFIG_FIELDS}
+        config_dict["extra_params"] = dict(self.extra_params)
         config_dict.update(self.extra_params)
         return config_dict
+
+
+_LLM_CONFIG_FIELDS = tuple(f.name for f in fields(LLMConfig))
@@ -1,11 +1,70 @@
 """Configuration utilities."""
 
+from collections.abc import Mapping
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
 from src.exceptions import ConfigError
 
 
+@lru_cache(maxsize=8)
+def _parse_env_file(path: str, _mtime_ns: int) -> Mapping[str, str]:
+    """Parse a .env file into a read-only mapping.
+
+    Results are cached per path and modification time, so the file is only
+    read again after it changes.
+
+    The file is read as UTF-8 in one call, ignoring a leading byte order mark.
+    Blank lines and ``#`` comments are skipped, and a value wrapped in
+    matching single or double quotes is unquoted.
+
+    Args:
+        path: Absolute path to the .env file.
+        _mtime_ns: Modification time of the file, only used as cache key.
+
+    Returns:
+        Variable values keyed by name; the first definition of a name wins.
+
+    """
+    values: dict[str, str] = {}
+    for raw_line in Path(path).read_bytes().decode("utf-8-sig").splitlines():
+        line = raw_line.strip()
+        if not line or line[0] == "#":
+            continue
+        name, sep, value = line.partition("=")
+        if not sep:
+            continue
+        value = value.strip()
+        if len(value) > 1 and value[0] == value[-1] and value[0] in "\"'":
+            value = value[1:-1]
+        values.setdefault(name.rstrip(), value)
+    return MappingProxyType(values)
+
+
+def _read_env_file(env_file: str | Path) -> Mapping[str, str]:
+    """Read the variables defined in a .env file.
+
+    Args:
+        env_file: Path to .env file.
+
+    Returns:
+        Variable values keyed by name.
+
+    Raises:
+        ConfigError: If .env file is not found.
+
+    """
+    env_path = Path(env_file).absolute()
+    try:
+        mtime_ns = env_path.stat().st_mtime_ns
+    except OSError:
+        msg = f"No {env_file} file found"
+        raise ConfigError(msg) from None
+    return _parse_env_file(str(env_path), mtime_ns)
+
+
 def load_env_var(key: str, env_file: str | Path = ".env") -> str:
     """Load environment variable from .env file.
 
@@ -20,18 +79,11 @@ def load_env_var(key: str, env_file: str | Path = ".env") -> str:
         ConfigError: If .env file is not found or key is not found.
 
     """
-    env_path = Path(env_file)
-    if not env_path.exists():
-        msg = f"No {env_file} file found"
+    value = _read_env_file(env_file).get(key)
+    if value is None:
+        msg = f"{key} not found in {env_file}"
         raise ConfigError(msg)
-
-    with env_path.open() as f:
-        for line in f:
-            if line.startswith(f"{key}="):
-                return line.split("=")[1].strip()
-
-    msg = f"{key} not found in {env_file}"
-    raise ConfigError(msg)
+    return value
 
 
 def load_config_from_env(
@@ -51,4 +103,9 @@ def load_config_from_env(
         ConfigError: If .env file is not found or any key is not found.
 
     """
-    return {key: load_env_var(key, env_file) for key in keys}
+    values = _read_env_file(env_file)
+    for key in keys:
+        if key not in values:
+            msg = f"{key} not found in {env_file}"
+            raise ConfigError(msg)
+    return {key: values[key] for key in keys}
@@ -2,15 +2,30 @@
 
 This package provides a unified interface for interacting with various LLM providers.
 The default model used throughout the application is 'gemini-2.0-flash-lite'.
+
+Exports are resolved lazily on first attribute access so that importing a
+submodule does not pull in every provider SDK.
 """
 
-from src.llm_providers.interface import LLMProvider
-from src.llm_providers.providers import (
-    BaseLLMProvider,
-    GeminiProvider,
-    ProviderProtocol,
-)
-from src.llm_providers.type_defs import GenerationConfig
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.llm_providers.interface import LLMProvider
+    from src.llm_providers.providers import (
+        BaseLLMProvider,
+        GeminiProvider,
+        ProviderProtocol,
+    )
+    from src.llm_providers.type_defs import GenerationConfig
+
+_LAZY_IMPORTS = {
+    "BaseLLMProvider": "src.llm_providers.providers.base",
+    "GeminiProvider": "src.llm_providers.providers.gemini",
+    "GenerationConfig": "src.llm_providers.type_defs",
+    "LLMProvider": "src.llm_providers.interface",
+    "ProviderProtocol": "src.llm_providers.providers.base",
+}
 
 __all__ = [
     "BaseLLMProvider",
@@ -19,3 +34,29 @@ __all__ = [
     "LLMProvider",
     "ProviderProtocol",
 ]
+
+
+def __getattr__(name: str) -> object:
+    """Import an exported name on first access.
+
+    Args:
+        name: Attribute name.
+
+    Returns:
+        The exported object.
+
+    Raises:
+        AttributeError: If the name is not exported.
+
+    """
+    if name not in _LAZY_IMPORTS:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List module attributes, including lazy exports."""
+    return sorted({*globals(), *_LAZY_IMPORTS})
@@ -1,21 +1,54 @@
 """Provider configuration module."""
 
-from dataclasses import dataclass, field
+from collections.abc import Callable, Mapping
+from copy import deepcopy
+from dataclasses import dataclass, fields
+from functools import cache
+from types import MappingProxyType
 from typing import Any, ClassVar
 
 from src.config import BaseConfig
 from src.exceptions import ConfigError, InvalidModelError
 from src.llm_providers.version import ProviderVersion, Version
 
+# Shared read-only default, replaced by a dict on the first extra parameter.
+_NO_EXTRA_PARAMS: Mapping[str, Any] = MappingProxyType({})
 
-@dataclass
+# Fields read by GeminiConfig.from_env:
+# (field name, environment key, default or None if required, converter).
+_GEMINI_ENV_FIELDS: tuple[tuple[str, str, str | None, Callable[[str], Any]], ...] = (
+    ("api_key", "GEMINI_API_KEY", None, str),
+    ("model", "GEMINI_MODEL", "gemini-pro", str),
+    ("temperature", "GEMINI_TEMPERATURE", "0.7", float),
+    ("max_output_tokens", "GEMINI_MAX_OUTPUT_TOKENS", "2048", int),
+    ("top_p", "GEMINI_TOP_P", "0.95", float),
+    ("top_k", "GEMINI_TOP_K", "40", int),
+)
+
+
+@cache
+def _required_env_keys(cls: type["ProviderConfig"]) -> tuple[str, ...]:
+    """Get the prefixed environment keys of a config class, once per class.
+
+    Args:
+        cls: Provider config class.
+
+    Returns:
+        Required keys, prefixed with the provider name.
+
+    """
+    provider_name = cls.__name__.replace("Config", "").upper()
+    return tuple(f"{provider_name}_{key}" for key in cls.REQUIRED_ENV_VARS)
+
+
+@dataclass(slots=True)
 class ProviderConfig(BaseConfig):
     """Base provider configuration."""
 
     api_key: str | None = None
     model: str | None = None
     version: Version | None = None
-    extra_params: dict[str, Any] = field(default_factory=dict)
+    extra_params: Mapping[str, Any] = _NO_EXTRA_PARAMS
 
     # Required environment variables
     REQUIRED_ENV_VARS: ClassVar[list[str]] = ["API_KEY", "MODEL"]
@@ -58,18 +91,58 @@ class ProviderConfig(BaseConfig):
             msg = f"Invalid model configuration: {e!s}"
             raise InvalidModelError(msg)
 
-    def required_keys(self) -> list[str]:
+    def __getstate__(self) -> tuple[None, dict[str, Any]]:
+        """Get the state used to pickle and copy the configuration.
+
+        Returns:
+            Slot state, with extra parameters as a plain dict.
+
+        """
+        state = {f.name: getattr(self, f.name) for f in fields(self)}
+        state["extra_params"] = dict(self.extra_params)
+        return None, state
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> "ProviderConfig":
+        """Deep copy the configuration.
+
+        Args:
+            memo: Objects already copied, keyed by id.
+
+        Returns:
+            Copy whose extra parameters are a plain dict.
+
+        """
+        result = object.__new__(type(self))
+        memo[id(self)] = result
+        _, state = self.__getstate__()
+        for name, value in deepcopy(state, memo).items():
+            setattr(result, name, value)
+        return result
+
+    def set_extra_param(self, key: str, value: object) -> None:
+        """Set an extra provider parameter.
+
+        Args:
+            key: Parameter name.
+            value: Parameter value.
+
+        """
+        if self.extra_params is _NO_EXTRA_PARAMS:
+            self.extra_params = {}
+        self.extra_params[key] = value
+
+    @classmethod
+    def required_keys(cls) -> list[str]:
         """Get required environment variable keys.
 
         Returns:
             List of required keys with provider prefix.
 
         """
-        provider_name = self.__class__.__name__.replace("Config", "").upper()
-        return [f"{provider_name}_{key}" for key in self.REQUIRED_ENV_VARS]
+        return list(_required_env_keys(cls))
 
 
-@dataclass
+@dataclass(slots=True)
 class GeminiConfig(ProviderConfig):
     """Gemini provider configuration."""
 
@@ -94,45 +167,40 @@ class GeminiConfig(ProviderConfig):
     def validate(self) -> None:
         """Validate configuration.
 
+        The sampling settings are checked before the model lookup.
+
         Raises:
             ConfigError: If configuration is invalid.
+            InvalidModelError: If model is not supported.
 
         """
-        try:
-            super().validate()
-
-            if not 0 <= self.temperature <= 1:
-                msg = "Temperature must be between 0 and 1"
-                raise ValueError(msg)
+        if not 0 <= self.temperature <= 1:
+            msg = "Temperature must be between 0 and 1"
+            raise ConfigError(msg)
 
-            if self.max_output_tokens <= 0:
-                msg = "Max tokens must be positive"
-                raise ValueError(msg)
+        if self.max_output_tokens <= 0:
+            msg = "Max tokens must be positive"
+            raise ConfigError(msg)
 
-            if not 0 <= self.top_p <= 1:
-                msg = "Top P must be between 0 and 1"
-                raise ValueError(msg)
+        if not 0 <= self.top_p <= 1:
+            msg = "Top P must be between 0 and 1"
+            raise ConfigError(msg)
 
-            if self.top_k <= 0:
-                msg = "Top K must be positive"
-                raise ValueError(msg)
+        if self.top_k <= 0:
+            msg = "Top K must be positive"
+            raise ConfigError(msg)
 
-        except ValueError as e:
-            raise ConfigError(str(e))
+        ProviderConfig.validate(self)
 
     @classmethod
     def from_env(cls, env_vars: dict[str, str]) -> "GeminiConfig":
         """Create config from environment variables."""
+        kwargs: dict[str, Any] = {}
         try:
-            return cls(
-                api_key=env_vars["GEMINI_API_KEY"],
-                model=env_vars.get("GEMINI_MODEL", "gemini-pro"),  # Ensure this is set
-                version=Version(1, 0, 0),  # Current version
-                temperature=float(env_vars.get("GEMINI_TEMPERATURE", "0.7")),
-                max_output_tokens=int(env_vars.get("GEMINI_MAX_OUTPUT_TOKENS", "2048")),
-                top_p=float(env_vars.get("GEMINI_TOP_P", "0.95")),
-                top_k=int(env_vars.get("GEMINI_TOP_K", "40")),
-            )
+            for field_name, key, default, convert in _GEMINI_ENV_FIELDS:
+                value = env_vars[key] if default is None else env_vars.get(key, default)
+                kwargs[field_name] = convert(value)
+            return cls(**kwargs, version=Version(1, 0, 0))  # Current version
         except (KeyError, ValueError) as e:
             msg = f"Invalid configuration: {e!s}"
             raise ConfigError(msg)
@@ -1,5 +1,10 @@
 """LLM provider factory."""
 
+import sys
+import threading
+from collections.abc import Mapping
+from importlib import import_module
+from types import MappingProxyType
 from typing import ClassVar
 
 from src.config.utils import load_config_from_env
@@ -13,24 +18,26 @@ from src.exceptions import (
 from src.llm_providers.config.provider_config import ProviderConfig
 from src.llm_providers.lifecycle import ProviderLifecycle, ProviderState
 from src.llm_providers.providers.base import BaseLLMProvider
-from src.llm_providers.providers.gemini import GeminiProvider
 from src.llm_providers.selection import ProviderCapability, ProviderSelector
 from src.llm_providers.version import ProviderVersion
 
 # Error messages
-PROVIDER_NOT_FOUND = "Provider {name} not found"
 API_KEY_REQUIRED = "API key is required"
 NO_PROVIDER_SET = "No provider set"
-UNSUPPORTED_PROVIDER = "Unsupported provider: {}"
-INVALID_PROVIDER = "Invalid provider class: {name}. Must implement BaseLLMProvider"
-PROVIDER_EXISTS = "Provider {name} already registered"
-PROVIDER_CONFIG_ERROR = "Failed to create config for provider {name}: {error}"
-VERSION_MISMATCH = (
-    "Provider {name} version {version} does not match required version {required}"
+
+# Default providers, registered when first looked up so their SDKs are only
+# imported when used: name -> (module, class name, version).
+_DEFAULT_PROVIDERS: Mapping[str, tuple[str, str, ProviderVersion | None]] = (
+    MappingProxyType(
+        {
+            "gemini": (
+                "src.llm_providers.providers.gemini",
+                "GeminiProvider",
+                ProviderVersion.GEMINI_V1,
+            ),
+        },
+    )
 )
-PROVIDER_NOT_READY = "Provider {name} is not ready (state: {state})"
-PROVIDER_UNHEALTHY = "Provider {name} is unhealthy: {error}"
-NO_SUITABLE_PROVIDER = "No suitable provider found for capabilities: {capabilities}"
 
 
 class ProviderNotFoundError(ValueError):
@@ -43,18 +50,26 @@ class ProviderNotFoundError(ValueError):
             name: Provider name.
 
         """
-        super().__init__(PROVIDER_NOT_FOUND.format(name=name))
+        self.name = name
+        super().__init__(f"Provider {name} not found")
 
 
 class LLMProviderFactory:
-    """Factory for creating LLM providers."""
+    """Factory for creating LLM providers.
+
+    All factory state is kept on the class, where the classmethods read it,
+    so the singleton instance itself holds no attributes.
+    """
+
+    __slots__ = ()
 
-    _instance: ClassVar[type["LLMProviderFactory"] | None] = None
-    _initialized: ClassVar[bool] = False
+    _instance: ClassVar["LLMProviderFactory | None"] = None
+    _lock: ClassVar[threading.Lock] = threading.Lock()
     _providers: ClassVar[dict[str, type[BaseLLMProvider]]] = {}
     _current_provider: ClassVar[BaseLLMProvider | None] = None
     _provider_name: ClassVar[str | None] = None
     _provider_configs: ClassVar[dict[str, ProviderConfig]] = {}
+    _loaded_configs: ClassVar[dict[str, ProviderConfig]] = {}
     _provider_versions: ClassVar[dict[str, ProviderVersion]] = {}
     _provider_lifecycles: ClassVar[dict[str, ProviderLifecycle]] = {}
     _selector: ClassVar[ProviderSelector | None] = None
@@ -62,23 +77,43 @@ class LLMProviderFactory:
     def __new__(cls) -> "LLMProviderFactory":
         """Create or return singleton instance.
 
+        The instance is created and set up at most once, even when several
+        threads ask for it at the same time.
+
         Returns:
             The singleton instance.
 
         """
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
-
-    def __init__(self) -> None:
-        """Initialize factory."""
-        if not self._initialized:
-            self._initialized = True
-            self._selector = ProviderSelector(
-                providers=self._provider_lifecycles,
-                versions=self._provider_versions,
-                fallback_chain=["gemini"],  # Default fallback chain
-            )
+        instance = cls._instance
+        if instance is None:
+            with cls._lock:
+                instance = cls._instance
+                if instance is None:
+                    cls._setup()
+                    instance = super().__new__(cls)
+                    cls._instance = instance
+        return instance
+
+    @classmethod
+    def _setup(cls) -> None:
+        """Set up the factory state shared by the singleton."""
+        cls._selector = ProviderSelector(
+            providers=cls._provider_lifecycles,
+            versions=cls._provider_versions,
+            fallback_chain=["gemini"],  # Default fallback chain
+        )
+
+    @classmethod
+    def _set_current_provider(cls, provider: BaseLLMProvider, name: str) -> None:
+        """Record the active provider.
+
+        Args:
+            provider: Provider instance.
+            name: Provider name.
+
+        """
+        cls._current_provider = provider
+        cls._provider_name = name
 
     @classmethod
     def _validate_provider_class(
@@ -97,14 +132,15 @@ class LLMProviderFactory:
             ConfigError: If provider already registered.
 
         """
-        if not issubclass(provider_cls, BaseLLMProvider):
-            raise InvalidModelError(INVALID_PROVIDER.format(name=name))
-
-        if not isinstance(provider_cls, type):
-            raise InvalidModelError(INVALID_PROVIDER.format(name=name))
+        if not (
+            isinstance(provider_cls, type) and issubclass(provider_cls, BaseLLMProvider)
+        ):
+            msg = f"Invalid provider class: {name}. Must implement BaseLLMProvider"
+            raise InvalidModelError(msg)
 
         if name in cls._providers:
-            raise ConfigError(PROVIDER_EXISTS.format(name=name))
+            msg = f"Provider {name} already registered"
+            raise ConfigError(msg)
 
     @classmethod
     def register_provider(
@@ -126,10 +162,30 @@ class LLMProviderFactory:
 
         """
         cls._validate_provider_class(name, provider_cls)
+        # Interned so lookups with the same literal name match by identity.
+        name = sys.intern(name)
         cls._providers[name] = provider_cls
         if version:
             cls._provider_versions[name] = version
 
+    @classmethod
+    def _find_provider(cls, name: str) -> type[BaseLLMProvider] | None:
+        """Find a provider class, registering a default provider on first use.
+
+        Args:
+            name: Provider name.
+
+        Returns:
+            Provider class, or None if no provider has this name.
+
+        """
+        provider_cls = cls._providers.get(name)
+        if provider_cls is None and name in _DEFAULT_PROVIDERS:
+            module_name, class_name, version = _DEFAULT_PROVIDERS[name]
+            provider_cls = getattr(import_module(module_name), class_name)
+            cls.register_provider(name, provider_cls, version=version)
+        return provider_cls
+
     @classmethod
     def get_provider(cls, name: str) -> type[BaseLLMProvider]:
         """Get a provider class.
@@ -144,9 +200,10 @@ class LLMProviderFactory:
             ProviderNotFoundError: If provider not found.
 
         """
-        if name not in cls._providers:
+        provider_cls = cls._find_provider(name)
+        if provider_cls is None:
             raise ProviderNotFoundError(name)
-        return cls._providers[name]
+        return provider_cls
 
     @classmethod
     def get_provider_version(cls, name: str) -> ProviderVersion:
@@ -162,9 +219,10 @@ class LLMProviderFactory:
             ProviderNotFoundError: If provider not found.
 
         """
-        if name not in cls._provider_versions:
+        version = cls._provider_versions.get(name)
+        if version is None:
             raise ProviderNotFoundError(name)
-        return cls._provider_versions[name]
+        return version
 
     @classmethod
     def get_current_provider(cls) -> BaseLLMProvider | None:
@@ -190,6 +248,9 @@ class LLMProviderFactory:
     def _load_provider_config(cls, name: str) -> ProviderConfig:
         """Load provider configuration.
 
+        The configuration is read from the environment once per provider and
+        reused until ``invalidate_config`` is called.
+
         Args:
             name: Provider name.
 
@@ -200,16 +261,79 @@ class LLMProviderFactory:
             ConfigError: If configuration loading fails.
 
         """
+        config = cls._loaded_configs.get(name)
+        if config is not None:
+            return config
         try:
-            provider_cls = cls.get_provider(name)
-            dummy_instance = provider_cls(
-                None,
-            )  # Create temporary instance to get config class
-            config_keys = dummy_instance.config.required_keys()
-            env_vars = load_config_from_env(config_keys)
-            return dummy_instance.config.__class__.from_env(env_vars)
+            config_cls = cls.get_provider(name).config_cls
+            env_vars = load_config_from_env(config_cls.required_keys())
+            config = config_cls.from_env(env_vars)
         except Exception as e:
-            raise ConfigError(PROVIDER_CONFIG_ERROR.format(name=name, error=str(e)))
+            msg = f"Failed to create config for provider {name}: {e!s}"
+            raise ConfigError(msg)
+        cls._loaded_configs[name] = config
+        return config
+
+    @classmethod
+    def invalidate_config(cls, name: str) -> None:
+        """Forget the loaded configuration of a provider.
+
+        The next provider created under this name reads its configuration
+        from the environment again.
+
+        Args:
+            name: Provider name.
+
+        """
+        cls._loaded_configs.pop(name, None)
+
+    @classmethod
+    def _mark_failed(cls, name: str | None) -> None:
+        """Put a provider's lifecycle into the error state, if it has one.
+
+        Args:
+            name: Provider name.
+
+        """
+        lifecycle = cls._provider_lifecycles.get(name) if name else None
+        if lifecycle is not None:
+            lifecycle.state = ProviderState.ERROR
+
+    def _named_lifecycle(self, name: str) -> ProviderLifecycle:
+        """Get the lifecycle of a named provider, creating it on first use.
+
+        Args:
+            name: Provider name.
+
+        Returns:
+            The provider's lifecycle.
+
+        Raises:
+            ValueError: If the provider is not supported.
+            ConfigError: If the provider has no version information.
+
+        """
+        provider_cls = self._find_provider(name)
+        if provider_cls is None:
+            msg = f"Unsupported provider: {name}"
+            raise ValueError(msg)
+
+        lifecycle = self._provider_lifecycles.get(name)
+        if lifecycle is None:
+            # Create new provider instance
+            config = self._load_provider_config(name)
+            provider = provider_cls(config.api_key)
+
+            # Create and initialize lifecycle
+            version = self._provider_versions.get(name)
+            if not version:
+                msg = f"No version information for provider {name}"
+                raise ConfigError(msg)
+
+            lifecycle = ProviderLifecycle(provider, version)
+            lifecycle.initialize()
+            self._provider_lifecycles[name] = lifecycle
+        return lifecycle
 
     def set_provider(
         self,
@@ -225,36 +349,14 @@ class LLMProviderFactory:
             temperature: Required temperature setting.
 
         Raises:
-            ValueError: If provider not supported.
-            ConfigError: If provider configuration is invalid.
+            ConfigError: If the provider is not supported, its configuration
+                is invalid or the requirements cannot be met.
             EmptyResponseError: If provider is unhealthy.
-            TemperatureError: If temperature requirements not met.
 
         """
         try:
             if name:
-                if name not in self._providers:
-                    raise ValueError(UNSUPPORTED_PROVIDER.format(name))
-
-                # Use specific provider
-                if name in self._provider_lifecycles:
-                    lifecycle = self._provider_lifecycles[name]
-                else:
-                    # Create new provider instance
-                    config = self._load_provider_config(name)
-                    provider_cls = self._providers[name]
-                    provider = provider_cls(config.api_key)
-
-                    # Create and initialize lifecycle
-                    version = self._provider_versions.get(name)
-                    if not version:
-                        msg = f"No version information for provider {name}"
-                        raise ConfigError(msg)
-
-                    lifecycle = ProviderLifecycle(provider, version)
-                    lifecycle.initialize()
-                    self._provider_lifecycles[name] = lifecycle
-
+                lifecycle = self._named_lifecycle(name)
             else:
                 # Select provider based on capabilities
                 if not self._selector:
@@ -265,16 +367,17 @@ class LLMProviderFactory:
 
             # Validate provider health
             if not lifecycle.check_health():
-                raise EmptyResponseError(
-                    PROVIDER_UNHEALTHY.format(
-                        name=name or lifecycle.provider.__class__.__name__,
-                        error=lifecycle.health.last_error or "Unknown error",
-                    ),
+                msg = (
+                    f"Provider {name or lifecycle.provider.__class__.__name__} "
+                    f"is unhealthy: {lifecycle.health.last_error or 'Unknown error'}"
                 )
+                raise EmptyResponseError(msg)
 
             # Set as current provider
-            self._current_provider = lifecycle.provider
-            self._provider_name = name or lifecycle.provider.__class__.__name__
+            self._set_current_provider(
+                lifecycle.provider,
+                name or lifecycle.provider.__class__.__name__,
+            )
             self._provider_configs[self._provider_name] = lifecycle.provider.config
 
             # Update load distribution
@@ -284,11 +387,16 @@ class LLMProviderFactory:
                     lifecycle.stats.requests_per_minute,
                 )
 
-        except Exception as e:
-            if name and name in self._provider_lifecycles:
-                self._provider_lifecycles[name].state = ProviderState.ERROR
+        except ConfigError:
+            self._mark_failed(name)
+            raise
+        except ValueError as e:
+            self._mark_failed(name)
             msg = f"Failed to initialize provider {name}: {e!s}"
-            raise ConfigError(msg)
+            raise ConfigError(msg) from e
+        except Exception:
+            self._mark_failed(name)
+            raise
 
     def get_fallback_provider(self) -> BaseLLMProvider:
         """Get next provider in fallback chain.
@@ -309,8 +417,10 @@ class LLMProviderFactory:
             msg = "No fallback providers available"
             raise RetryError(msg)
 
-        self._current_provider = lifecycle.provider
-        self._provider_name = lifecycle.provider.__class__.__name__
+        self._set_current_provider(
+            lifecycle.provider,
+            lifecycle.provider.__class__.__name__,
+        )
         return lifecycle.provider
 
     def reset_fallback_chain(self) -> None:
@@ -329,7 +439,7 @@ class LLMProviderFactory:
 
         """
         for name in providers:
-            if name not in self._providers:
+            if self._find_provider(name) is None:
                 msg = f"Provider {name} not registered"
                 raise ConfigError(msg)
 
@@ -354,7 +464,8 @@ class LLMProviderFactory:
             ProviderNotFoundError: If provider not found.
 
         """
-        if name not in cls._providers:
+        provider_cls = cls._find_provider(name)
+        if provider_cls is None:
             raise ProviderNotFoundError(name)
 
         try:
@@ -365,7 +476,6 @@ class LLMProviderFactory:
             if not api_key:
                 raise APIKeyError(API_KEY_REQUIRED)
 
-            provider_cls = cls._providers[name]
             provider = provider_cls(api_key)
 
             # Create and initialize lifecycle
@@ -379,11 +489,16 @@ class LLMProviderFactory:
 
         except APIKeyError:
             raise
-        except Exception as e:
-            if name in cls._provider_lifecycles:
-                cls._provider_lifecycles[name].state = ProviderState.ERROR
+        except ConfigError:
+            cls._mark_failed(name)
+            raise
+        except ValueError as e:
+            cls._mark_failed(name)
             msg = f"Failed to create provider {name}: {e!s}"
-            raise ConfigError(msg)
+            raise ConfigError(msg) from e
+        except Exception:
+            cls._mark_failed(name)
+            raise
 
     @classmethod
     def cleanup_provider(cls, name: str) -> None:
@@ -396,27 +511,16 @@ class LLMProviderFactory:
             ProviderNotFoundError: If provider not found.
 
         """
-        if name not in cls._provider_lifecycles:
+        lifecycle = cls._provider_lifecycles.get(name)
+        if lifecycle is None:
             raise ProviderNotFoundError(name)
 
-        try:
-            lifecycle = cls._provider_lifecycles[name]
-            lifecycle.cleanup()
+        lifecycle.cleanup()
 
-            if name == cls._provider_name:
-                cls._current_provider = None
-                cls._provider_name = None
+        if name == cls._provider_name:
+            cls._current_provider = None
+            cls._provider_name = None
 
-            del cls._provider_lifecycles[name]
+        del cls._provider_lifecycles[name]
+        cls.invalidate_config(name)
 
-        except Exception as e:
-            msg = f"Failed to clean up provider {name}: {e!s}"
-            raise ConfigError(msg)
-
-
-# Register default providers
-LLMProviderFactory.register_provider(
-    "gemini",
-    GeminiProvider,
-    version=ProviderVersion.GEMINI_V1,
-)
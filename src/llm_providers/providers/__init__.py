@@ -1,10 +1,50 @@
-"""LLM provider implementations."""
+"""LLM provider implementations.
 
-from src.llm_providers.providers.base import BaseLLMProvider, ProviderProtocol
-from src.llm_providers.providers.gemini import GeminiProvider
+Exports are resolved lazily on first attribute access so that importing the
+base provider does not pull in every provider SDK.
+"""
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.llm_providers.providers.base import BaseLLMProvider, ProviderProtocol
+    from src.llm_providers.providers.gemini import GeminiProvider
+
+_LAZY_IMPORTS = {
+    "BaseLLMProvider": "src.llm_providers.providers.base",
+    "GeminiProvider": "src.llm_providers.providers.gemini",
+    "ProviderProtocol": "src.llm_providers.providers.base",
+}
 
 __all__ = [
     "BaseLLMProvider",
     "GeminiProvider",
     "ProviderProtocol",
 ]
+
+
+def __getattr__(name: str) -> object:
+    """Import an exported name on first access.
+
+    Args:
+        name: Attribute name.
+
+    Returns:
+        The exported object.
+
+    Raises:
+        AttributeError: If the name is not exported.
+
+    """
+    if name not in _LAZY_IMPORTS:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List module attributes, including lazy exports."""
+    return sorted({*globals(), *_LAZY_IMPORTS})
@@ -2,7 +2,7 @@
 
 from abc import ABC, abstractmethod
 from collections.abc import AsyncGenerator
-from typing import Protocol, runtime_checkable
+from typing import ClassVar, Protocol, runtime_checkable
 
 from src.llm_providers.config.provider_config import ProviderConfig
 
@@ -57,6 +57,9 @@ class ProviderProtocol(Protocol):
 class BaseLLMProvider(ABC):
     """Abstract base class for LLM providers."""
 
+    # Configuration class, readable without creating a provider.
+    config_cls: ClassVar[type[ProviderConfig]] = ProviderConfig
+
     def __init__(self, api_key: str | None = None) -> None:
         """Initialize provider.
 
@@ -35,22 +35,29 @@ class GeminiProvider(BaseLLMProvider):
         _model: The underlying Gemini model instance.
         _config: Provider configuration.
         _default_model: Default model name.
+        config_cls: Configuration class used by the factory.
 
     """
 
     _model: GenerativeModel | None = None
     _config: GeminiConfig | None = None
     _default_model: ClassVar[str] = "gemini-2.0-flash-lite"
+    config_cls: ClassVar[type[GeminiConfig]] = GeminiConfig
 
     def __init__(self, config: GeminiConfig) -> None:
         """Initialize provider.
 
+        The configuration is used as given. ``BaseLLMProvider.__init__``
+        expects an API key and would build a bare config from it, dropping
+        the model and generation settings.
+
         Args:
             config: Provider configuration.
 
         """
-        super().__init__(config)
+        self.config = config
         self._config = config
+        self._validate_config()
         self._initialize()
 
     def _create_config(self, api_key: str | None = None) -> GeminiConfig:
@@ -88,7 +95,15 @@ class GeminiProvider(BaseLLMProvider):
         genai.configure(api_key=self._config.api_key)
         model_name = self._config.model or self._default_model
         try:
-            self._model = genai.GenerativeModel(model_name)
+            self._model = genai.GenerativeModel(
+                model_name,
+                generation_config={
+                    "temperature": self._config.temperature,
+                    "max_output_tokens": self._config.max_output_tokens,
+                    "top_p": self._config.top_p,
+                    "top_k": self._config.top_k,
+                },
+            )
         except Exception as e:
             msg = f"Failed to initialize model: {e}"
             raise ConfigError(msg) from e
@@ -1,21 +1,29 @@
 """LLM provider factory utilities."""
 
 import os
+import sys
+import threading
+from collections.abc import Mapping
+from importlib import import_module
 from pathlib import Path
+from types import MappingProxyType
 from typing import ClassVar
 
 from dotenv import load_dotenv
 
 from src.llm_providers.providers.base import BaseLLMProvider
-from src.llm_providers.providers.gemini import GeminiProvider
 
 # Error messages
 API_KEY_ERROR = "GEMINI_API_KEY not found in .env file"
 PROVIDER_NOT_SET_ERROR = "No provider set"
-UNSUPPORTED_PROVIDER_ERROR = "Unsupported provider: {}"
-PROVIDER_NOT_FOUND = "Provider {name} not found"
 API_KEY_REQUIRED = "API key is required"
 
+# Default providers, registered when first looked up so their SDKs are only
+# imported when used: name -> (module, class name).
+_DEFAULT_PROVIDERS: Mapping[str, tuple[str, str]] = MappingProxyType(
+    {"gemini": ("src.llm_providers.providers.gemini", "GeminiProvider")},
+)
+
 
 class ProviderNotFoundError(ValueError):
     """Raised when provider is not found."""
@@ -27,47 +35,66 @@ class ProviderNotFoundError(ValueError):
             name: Provider name.
 
         """
-        super().__init__(PROVIDER_NOT_FOUND.format(name=name))
+        self.name = name
+        super().__init__(f"Provider {name} not found")
 
 
 class LLMProviderFactory:
     """Factory for creating LLM providers."""
 
-    _instance: ClassVar[type["LLMProviderFactory"] | None] = None
-    _initialized: ClassVar[bool] = False
+    __slots__ = ("_api_key", "_current_provider", "_provider_name")
+
+    _instance: ClassVar["LLMProviderFactory | None"] = None
+    _lock: ClassVar[threading.Lock] = threading.Lock()
     _providers: ClassVar[dict[str, type[BaseLLMProvider]]] = {}
 
     def __new__(cls) -> "LLMProviderFactory":
         """Create or return singleton instance.
 
+        The instance is created and set up at most once, even when several
+        threads ask for it at the same time. If setup fails, the next call
+        tries again.
+
         Returns:
             The singleton instance.
 
+        Raises:
+            ValueError: If the API key is not found.
+
+        """
+        instance = cls._instance
+        if instance is None:
+            with cls._lock:
+                instance = cls._instance
+                if instance is None:
+                    instance = super().__new__(cls)
+                    instance._setup()
+                    cls._instance = instance
+        return instance
+
+    def _setup(self) -> None:
+        """Set up the singleton instance.
+
+        Raises:
+            ValueError: If the API key is not found.
+
         """
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
-
-    def __init__(self) -> None:
-        """Initialize factory."""
-        if not self._initialized:
-            # Load environment variables from .env file
-            env_path = Path(".env")
-            if not env_path.exists():
-                raise ValueError(API_KEY_ERROR)
-            load_dotenv(env_path)
-
-            # Get API key from environment variables
-            self._api_key = os.getenv("GEMINI_API_KEY")
-            if not self._api_key:
-                raise ValueError(API_KEY_ERROR)
-
-            self._current_provider: BaseLLMProvider | None = None
-            self._provider_name: str | None = None
-
-            # Set default provider
-            self.set_provider("gemini")
-            self._initialized = True
+        # Load environment variables from .env file
+        env_path = Path(".env")
+        if not env_path.exists():
+            raise ValueError(API_KEY_ERROR)
+        load_dotenv(env_path)
+
+        # Get API key from environment variables
+        self._api_key = os.getenv("GEMINI_API_KEY")
+        if not self._api_key:
+            raise ValueError(API_KEY_ERROR)
+
+        self._current_provider: BaseLLMProvider | None = None
+        self._provider_name: str | None = None
+
+        # Set default provider
+        self.set_provider("gemini")
 
     @classmethod
     def register_provider(cls, name: str, provider_cls: type[BaseLLMProvider]) -> None:
@@ -78,27 +105,55 @@ class LLMProviderFactory:
             provider_cls: Provider class.
 
         """
+        # Interned so lookups with the same literal name match by identity.
+        name = sys.intern(name)
         cls._providers[name] = provider_cls
 
+    @classmethod
+    def _find_provider(cls, name: str) -> type[BaseLLMProvider] | None:
+        """Find a provider class, registering a default provider on first use.
+
+        Args:
+            name: Provider name.
+
+        Returns:
+            Provider class, or None if no provider has this name.
+
+        """
+        provider_cls = cls._providers.get(name)
+        if provider_cls is None and name in _DEFAULT_PROVIDERS:
+            module_name, class_name = _DEFAULT_PROVIDERS[name]
+            provider_cls = getattr(import_module(module_name), class_name)
+            cls.register_provider(name, provider_cls)
+        return provider_cls
+
     @classmethod
     def create_provider(cls, name: str, api_key: str) -> BaseLLMProvider:
         """Create provider instance."""
         if not api_key:
             raise ValueError(API_KEY_REQUIRED)
 
-        provider_class = cls._providers.get(name)
+        provider_class = cls._find_provider(name)
         if not provider_class:
-            raise ValueError(PROVIDER_NOT_FOUND.format(name=name))
+            msg = f"Provider {name} not found"
+            raise ValueError(msg)
 
         return provider_class(api_key)
 
     def set_provider(self, name: str) -> None:
-        """Set the active provider."""
-        if name not in self._providers:
-            error_msg = UNSUPPORTED_PROVIDER_ERROR.format(name)
+        """Set the active provider.
+
+        The factory's API key never changes, so selecting the provider that
+        is already active keeps the existing instance.
+        """
+        if name == self._provider_name and self._current_provider is not None:
+            return
+        provider_cls = self._find_provider(name)
+        if provider_cls is None:
+            error_msg = f"Unsupported provider: {name}"
             raise ValueError(error_msg)
         self._provider_name = name
-        self._current_provider = self._providers[name](self._api_key)
+        self._current_provider = provider_cls(self._api_key)
 
     def get_provider(self) -> BaseLLMProvider:
         """Get the current provider instance."""
@@ -129,10 +184,8 @@ class LLMProviderFactory:
             ProviderNotFoundError: If provider not found.
 
         """
-        if name not in cls._providers:
+        provider_cls = cls._find_provider(name)
+        if provider_cls is None:
             raise ProviderNotFoundError(name)
-        return cls._providers[name]
-
+        return provider_cls
 
-# Register default providers
-LLMProviderFactory.register_provider("gemini", GeminiProvider)
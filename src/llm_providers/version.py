@@ -108,13 +108,14 @@ class ProviderVersion:
         if model_name is None:
             model_name = self.default_model
 
-        if model_name not in self.supported_models:
+        model = self.supported_models.get(model_name)
+        if model is None:
             msg = f"Model {model_name} not supported by provider {self.name}@{self.version}"
             raise InvalidModelError(
                 msg,
             )
 
-        return self.supported_models[model_name]
+        return model
 
     def supports_capability(
         self, capability: str, model_name: str | None = None,
@@ -141,6 +142,17 @@ ProviderVersion.GEMINI_V1 = ProviderVersion(
     name="gemini",
     version=Version(1, 0, 0),
     supported_models={
+        "gemini-2.0-flash-lite": ModelVersion(
+            name="gemini-2.0-flash-lite",
+            version=Version(2, 0, 0),
+            capabilities=[
+                "text-generation",
+                "chat",
+                "code-generation",
+                "code-analysis",
+            ],
+            min_provider_version=Version(1, 0, 0),
+        ),
         "gemini-pro": ModelVersion(
             name="gemini-pro",
             version=Version(1, 0, 0),
@@ -6,12 +6,19 @@ from datetime import UTC, datetime
 from enum import Enum
 from typing import TypeVar
 
-from langchain_core.messages import AIMessage, HumanMessage, SystemMessage, ToolMessage
+from langchain_core.messages import (
+    AIMessage,
+    BaseMessage,
+    HumanMessage,
+    SystemMessage,
+    ToolMessage,
+)
 
 from src.agent.agent_types.agent_types import Message
 from src.exceptions import ConfigError
 
 T = TypeVar("T")
+M = TypeVar("M", bound=BaseMessage)
 MessageValue = (
     str | int | float | bool | dict[str, "MessageValue"] | list["MessageValue"] | None
 )
@@ -174,6 +181,31 @@ class MessageChain:
         return []  # Placeholder for actual filtering logic
 
 
+def _create_message(
+    message_cls: type[M],
+    content: str,
+    metadata: dict[str, object] | None = None,
+    **fields: str,
+) -> M:
+    """Create a langchain message with metadata attached.
+
+    Args:
+        message_cls: Message class to instantiate.
+        content: The message content.
+        metadata: Optional metadata to attach to the message.
+        **fields: Extra message fields, e.g. ``tool_call_id``.
+
+    Returns:
+        A message instance.
+
+    """
+    return message_cls(
+        content=content,
+        additional_kwargs={"metadata": {} if metadata is None else metadata},
+        **fields,
+    )
+
+
 def create_system_message(
     content: str,
     metadata: dict[str, object] | None = None,
@@ -188,9 +220,7 @@ def create_system_message(
         A SystemMessage instance.
 
     """
-    if metadata is None:
-        metadata = {}
-    return SystemMessage(content=content, additional_kwargs={"metadata": metadata})
+    return _create_message(SystemMessage, content, metadata)
 
 
 def create_human_message(
@@ -207,9 +237,7 @@ def create_human_message(
         A HumanMessage instance.
 
     """
-    if metadata is None:
-        metadata = {}
-    return HumanMessage(content=content, additional_kwargs={"metadata": metadata})
+    return _create_message(HumanMessage, content, metadata)
 
 
 def create_ai_message(
@@ -226,9 +254,7 @@ def create_ai_message(
         An AIMessage instance.
 
     """
-    if metadata is None:
-        metadata = {}
-    return AIMessage(content=content, additional_kwargs={"metadata": metadata})
+    return _create_message(AIMessage, content, metadata)
 
 
 def create_tool_message(
@@ -247,13 +273,7 @@ def create_tool_message(
         A ToolMessage instance.
 
     """
-    if metadata is None:
-        metadata = {}
-    return ToolMessage(
-        content=content,
-        tool_call_id=tool_call_id,
-        additional_kwargs={"metadata": metadata},
-    )
+    return _create_message(ToolMessage, content, metadata, tool_call_id=tool_call_id)
 
 
 def get_message_metadata(
@@ -1,5 +1,9 @@
 """Prompt templates for the agent."""
 
+from functools import cache, lru_cache
+from string import Formatter
+from types import MappingProxyType
+
 from src.agent.state.base import AgentState
 from src.common_types.enums import AgentStep
 
@@ -60,17 +64,59 @@ Implementation:
 Task: {task}
 """
 
-STEP_PROMPTS = {
-    AgentStep.UNDERSTAND: UNDERSTAND_PROMPT,
-    AgentStep.PLAN: PLAN_PROMPT,
-    AgentStep.EXECUTE: EXECUTE_PROMPT,
-    AgentStep.VERIFY: VERIFY_PROMPT,
-}
+# Number of rendered prompts kept for repeated tasks.
+_PROMPT_CACHE_SIZE = 256
+
+# Read-only: parsed fields and rendered prompts are cached per step.
+STEP_PROMPTS = MappingProxyType(
+    {
+        AgentStep.UNDERSTAND: UNDERSTAND_PROMPT,
+        AgentStep.PLAN: PLAN_PROMPT,
+        AgentStep.EXECUTE: EXECUTE_PROMPT,
+        AgentStep.VERIFY: VERIFY_PROMPT,
+    },
+)
+
+
+@cache
+def get_prompt_fields(step: AgentStep) -> tuple[str, ...]:
+    """Get the context keys referenced by a step's prompt template.
+
+    Args:
+        step: Agent step.
+
+    Returns:
+        Names of the template fields, in order of appearance.
+
+    """
+    return tuple(
+        name for _, name, _, _ in Formatter().parse(STEP_PROMPTS[step]) if name
+    )
+
+
+@lru_cache(maxsize=_PROMPT_CACHE_SIZE)
+def _render_prompt(step: AgentStep, values: tuple[object, ...]) -> str:
+    """Render a step's prompt template.
+
+    Args:
+        step: Agent step.
+        values: Values for the template fields, in ``get_prompt_fields`` order.
+
+    Returns:
+        Rendered prompt.
+
+    """
+    return STEP_PROMPTS[step].format(
+        **dict(zip(get_prompt_fields(step), values, strict=True)),
+    )
 
 
 def get_step_prompt(state: AgentState) -> str:
     """Get prompt for current step.
 
+    Only the context keys the step's template references are looked up, and
+    rendered prompts are memoized on those values.
+
     Args:
         state: Current agent state.
 
@@ -79,17 +125,9 @@ def get_step_prompt(state: AgentState) -> str:
 
     """
     step = state.current_step
-    prompt = STEP_PROMPTS[step]
-
-    # Get context for prompt
-    task = state.get_context("task", "")
-    understanding = state.get_context("understanding", "")
-    plan = state.get_context("plan", "")
-    implementation = state.get_context("implementation", "")
-
-    return prompt.format(
-        task=task,
-        understanding=understanding,
-        plan=plan,
-        implementation=implementation,
-    )
+    values = tuple(state.get_context(key, "") for key in get_prompt_fields(step))
+    try:
+        return _render_prompt(step, values)
+    except TypeError:
+        # Unhashable context values cannot be cached; render them directly.
+        return _render_prompt.__wrapped__(step, values)
@@ -0,0 +1,8 @@
+"""Shared pytest configuration."""
+
+import sys
+
+# Test runs are short-lived and often start from a clean checkout; skip writing
+# bytecode caches (and pytest's rewritten-assert caches) for modules imported
+# from here on.
+sys.dont_write_bytecode = True
@@ -0,0 +1,27 @@
+"""Test agent configuration."""
+
+from src.config.agent import AgentConfig
+from src.config.llm import LLMConfig
+
+
+def test_update_coerces_model_mapping() -> None:
+    """Test a model mapping set through update validates as an LLMConfig."""
+    config = AgentConfig()
+
+    config.update({"model": {"model": "gemini-2.0-flash-lite"}})
+    config.validate()
+
+    assert isinstance(config.model, LLMConfig)
+    assert config.model.model == "gemini-2.0-flash-lite"
+
+
+def test_update_merges_into_llm_config() -> None:
+    """Test a model mapping updates an existing LLMConfig in place."""
+    config = AgentConfig(model={"model": "gemini-2.0-flash-lite"})
+    model = config.model
+
+    config.update({"model": {"temperature": 0.2}})
+    config.validate()
+
+    assert config.model is model
+    assert model.temperature == 0.2
@@ -0,0 +1,162 @@
+"""Test the command line interface."""
+
+import asyncio
+import importlib
+from collections.abc import AsyncGenerator, Iterator
+from pathlib import Path
+from typing import ClassVar
+
+import pytest
+from click.testing import CliRunner
+
+from src.agent.agent_types.agent_types import Message
+from src.llm_providers.config.provider_config import GeminiConfig
+from src.llm_providers.providers import gemini
+
+cli_main = importlib.import_module("src.cli.main")
+
+
+class FakeProvider:
+    """Provider that echoes its configuration instead of calling Gemini."""
+
+    instances: ClassVar[list["FakeProvider"]] = []
+    in_flight: ClassVar[int] = 0
+    max_in_flight: ClassVar[int] = 0
+
+    def __init__(self, config: GeminiConfig) -> None:
+        """Initialize provider.
+
+        Args:
+            config: Provider configuration.
+
+        """
+        self.config = config
+        FakeProvider.instances.append(self)
+
+    def _reply(self, messages: list[Message]) -> str:
+        """Describe the settings and the task."""
+        config = self.config
+        return (
+            f"{config.model} {config.temperature} {config.max_output_tokens}: "
+            f"{messages[0].content}"
+        )
+
+    def generate(self, messages: list[Message]) -> str:
+        """Return the reply in one piece."""
+        return self._reply(messages)
+
+    async def generate_stream(
+        self,
+        messages: list[Message],
+    ) -> AsyncGenerator[str, None]:
+        """Return the reply as a stream, tracking concurrent calls."""
+        if messages[0].content == "fail":
+            msg = "Generation failed"
+            raise RuntimeError(msg)
+        FakeProvider.in_flight += 1
+        FakeProvider.max_in_flight = max(
+            FakeProvider.max_in_flight,
+            FakeProvider.in_flight,
+        )
+        await asyncio.sleep(0.01)
+        FakeProvider.in_flight -= 1
+        yield self._reply(messages)
+
+
+@pytest.fixture(autouse=True)
+def fake_provider(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    """Replace the Gemini provider and API key lookup."""
+    monkeypatch.setattr(gemini, "GeminiProvider", FakeProvider)
+    monkeypatch.setattr(cli_main, "load_env_var", lambda _key: "test-key")
+    FakeProvider.instances = []
+    FakeProvider.in_flight = 0
+    FakeProvider.max_in_flight = 0
+    cli_main._shared_provider.cache_clear()
+    yield
+    cli_main._shared_provider.cache_clear()
+
+
+def test_solve_passes_options_to_provider() -> None:
+    """Test generation options reach the provider configuration."""
+    result = CliRunner().invoke(
+        cli_main.cli,
+        [
+            "solve",
+            "task",
+            "--model",
+            "gemini-pro",
+            "--temperature",
+            "0.3",
+            "--max-tokens",
+            "42",
+        ],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "gemini-pro 0.3 42: task" in result.output
+    config = FakeProvider.instances[0].config
+    assert config.api_key == "test-key"
+
+
+def write_tasks(tmp_path: Path, *tasks: str) -> str:
+    """Write a task file with one task per line."""
+    path = tmp_path / "tasks.txt"
+    path.write_text("\n".join(tasks) + "\n\n", encoding="utf-8")
+    return str(path)
+
+
+def test_solve_batch_passes_options_to_provider(tmp_path: Path) -> None:
+    """Test every task is solved with the requested generation options."""
+    result = CliRunner().invoke(
+        cli_main.cli,
+        [
+            "solve-batch",
+            write_tasks(tmp_path, "first", "säkert"),
+            "--model",
+            "gemini-pro",
+            "--temperature",
+            "0.3",
+            "--max-tokens",
+            "42",
+        ],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "# first\ngemini-pro 0.3 42: first\n" in result.output
+    assert "# säkert\ngemini-pro 0.3 42: säkert\n" in result.output
+    assert len(FakeProvider.instances) == 1
+
+
+def test_solve_batch_limits_concurrency(tmp_path: Path) -> None:
+    """Test no more than --concurrency tasks are solved at once."""
+    tasks = write_tasks(tmp_path, *(f"task {i}" for i in range(6)))
+
+    result = CliRunner().invoke(
+        cli_main.cli,
+        ["solve-batch", tasks, "--concurrency", "2"],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert FakeProvider.max_in_flight == 2
+
+
+def test_solve_batch_rejects_zero_concurrency(tmp_path: Path) -> None:
+    """Test --concurrency must be at least one."""
+    result = CliRunner().invoke(
+        cli_main.cli,
+        ["solve-batch", write_tasks(tmp_path, "task"), "--concurrency", "0"],
+    )
+
+    assert result.exit_code == 2
+
+
+def test_solve_batch_reports_failed_tasks(tmp_path: Path) -> None:
+    """Test other tasks still finish and the command exits with an error."""
+    result = CliRunner().invoke(
+        cli_main.cli,
+        ["solve-batch", write_tasks(tmp_path, "fail", "ok")],
+    )
+
+    assert result.exit_code == 1
+    assert "Error processing task: Generation failed" in result.output
+    assert "gemini-2.0-flash-lite 0.7 1000: ok" in result.output
@@ -0,0 +1,73 @@
+"""Test configuration utilities."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from src.config.utils import load_config_from_env, load_env_var
+from src.exceptions import ConfigError
+
+
+def write_env(path: Path, content: str, mtime_ns: int) -> None:
+    """Write a .env file with a fixed modification time."""
+    path.write_text(content)
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_load_env_var(tmp_path: Path) -> None:
+    """Test values are read from the .env file."""
+    env_file = tmp_path / ".env"
+    write_env(env_file, "API_KEY=secret\nMODEL=gemini\n", 1_000_000_000)
+
+    assert load_env_var("API_KEY", env_file) == "secret"
+    assert load_config_from_env(["MODEL", "API_KEY"], env_file) == {
+        "MODEL": "gemini",
+        "API_KEY": "secret",
+    }
+
+
+def test_load_env_var_rereads_changed_file(tmp_path: Path) -> None:
+    """Test the cached parse is refreshed when the file changes."""
+    env_file = tmp_path / ".env"
+    write_env(env_file, "API_KEY=old\n", 1_000_000_000)
+    assert load_env_var("API_KEY", env_file) == "old"
+
+    write_env(env_file, "API_KEY=new\n", 2_000_000_000)
+    assert load_env_var("API_KEY", env_file) == "new"
+
+
+def test_load_env_var_missing(tmp_path: Path) -> None:
+    """Test missing files and keys are reported."""
+    env_file = tmp_path / ".env"
+
+    with pytest.raises(ConfigError, match=r"No .* file found"):
+        load_env_var("API_KEY", env_file)
+
+    write_env(env_file, "MODEL=gemini\n", 1_000_000_000)
+    with pytest.raises(ConfigError, match="API_KEY not found"):
+        load_config_from_env(["MODEL", "API_KEY"], env_file)
+
+
+def test_load_env_var_parsing(tmp_path: Path) -> None:
+    """Test comments, quotes and '=' inside values."""
+    env_file = tmp_path / ".env"
+    write_env(
+        env_file,
+        '# comment\n\nTOKEN = abc==\nQUOTED="a b"\nSINGLE=\'c\'\nTOKEN=later\n',
+        1_000_000_000,
+    )
+
+    assert load_config_from_env(["TOKEN", "QUOTED", "SINGLE"], env_file) == {
+        "TOKEN": "abc==",
+        "QUOTED": "a b",
+        "SINGLE": "c",
+    }
+
+
+def test_load_env_var_ignores_bom(tmp_path: Path) -> None:
+    """Test a UTF-8 byte order mark does not end up in the first name."""
+    env_file = tmp_path / ".env"
+    env_file.write_bytes(b"\xef\xbb\xbfAPI_KEY=secret\n")
+
+    assert load_env_var("API_KEY", env_file) == "secret"
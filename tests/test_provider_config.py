@@ -0,0 +1,40 @@
+"""Test provider configuration."""
+
+import copy
+from dataclasses import asdict
+
+from src.llm_providers.config.provider_config import GeminiConfig, ProviderConfig
+
+
+def test_configs_share_empty_extra_params() -> None:
+    """Test configs without extra parameters share one empty mapping."""
+    first = ProviderConfig()
+    second = ProviderConfig()
+
+    assert first.extra_params is second.extra_params
+    assert not first.extra_params
+
+
+def test_set_extra_param_copies_shared_default() -> None:
+    """Test the first extra parameter leaves the shared default empty."""
+    config = ProviderConfig()
+    other = ProviderConfig()
+
+    config.set_extra_param("seed", 42)
+    config.set_extra_param("stop", ["\n"])
+
+    assert config.extra_params == {"seed": 42, "stop": ["\n"]}
+    assert config.extra_params is not other.extra_params
+    assert not other.extra_params
+    assert not ProviderConfig().extra_params
+
+
+def test_default_config_copies_and_converts() -> None:
+    """Test a default config survives deepcopy and asdict."""
+    config = GeminiConfig(api_key="k")
+
+    copied = copy.deepcopy(config)
+
+    assert copied == config
+    assert asdict(copied)["extra_params"] == {}
+    assert type(config.to_dict()["extra_params"]) is dict
@@ -0,0 +1,53 @@
+"""Test the LLM provider factories."""
+
+import subprocess
+import sys
+
+import pytest
+
+from src.llm_providers.utils.factory import LLMProviderFactory
+
+
+@pytest.mark.parametrize(
+    "module",
+    ["src.llm_providers.factory", "src.llm_providers.utils.factory"],
+)
+def test_factory_import_defers_provider_sdk(module: str) -> None:
+    """Test importing a factory does not load the Gemini SDK."""
+    code = f"import sys, {module}; print('google.generativeai' in sys.modules)"
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+
+    assert result.stdout.strip() == "False"
+
+
+class CountingProvider:
+    """Provider stub that counts how often it is constructed."""
+
+    created = 0
+
+    def __init__(self, api_key: str) -> None:
+        """Record the API key and count the instance."""
+        self.api_key = api_key
+        CountingProvider.created += 1
+
+
+def test_set_provider_keeps_active_instance(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test selecting the active provider again keeps its instance."""
+    monkeypatch.setitem(LLMProviderFactory._providers, "counting", CountingProvider)
+    monkeypatch.setattr(CountingProvider, "created", 0)
+    factory = object.__new__(LLMProviderFactory)
+    factory._api_key = "test-key"
+    factory._current_provider = None
+    factory._provider_name = None
+
+    factory.set_provider("counting")
+    first = factory.get_provider()
+    factory.set_provider("counting")
+
+    assert factory.get_provider() is first
+    assert CountingProvider.created == 1
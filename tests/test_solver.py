@@ -0,0 +1,112 @@
+"""Test the solver agent."""
+
+import pytest
+
+from src.agent.agent_types.agent_types import Message
+from src.agent.solver import SolverAgent
+from src.config.agent import AgentConfig
+
+
+class StubProvider:
+    """Provider that numbers its responses."""
+
+    def __init__(self) -> None:
+        """Initialize provider."""
+        self.calls = 0
+
+    def generate(self, messages: list[Message]) -> str:
+        """Return a new response for every call."""
+        self.calls += 1
+        return f"response {self.calls}"
+
+
+def make_agent(cache_size: int = 0) -> tuple[SolverAgent, StubProvider]:
+    """Build an agent on a stub provider."""
+    provider = StubProvider()
+    config = AgentConfig(response_cache_size=cache_size)
+    return SolverAgent(provider=provider, config=config), provider
+
+
+def test_response_cache_is_disabled_by_default() -> None:
+    """Test every call reaches the provider without a cache size."""
+    agent, provider = make_agent()
+
+    assert agent.process("task") == "response 1"
+    assert agent.process("task") == "response 2"
+    assert provider.calls == 2
+
+
+def test_response_cache_hits_repeated_input() -> None:
+    """Test the same input is answered from the cache as history grows."""
+    agent, provider = make_agent(cache_size=2)
+
+    assert agent.process("task") == "response 1"
+    assert agent.process("task") == "response 1"
+    assert provider.calls == 1
+    assert agent.state.messages[-1].content == "response 1"
+
+
+def test_response_cache_misses_new_input() -> None:
+    """Test different inputs are generated separately."""
+    agent, provider = make_agent(cache_size=2)
+
+    assert agent.process("first") == "response 1"
+    assert agent.process("second") == "response 2"
+    assert provider.calls == 2
+
+
+def test_response_cache_evicts_least_recently_used() -> None:
+    """Test the oldest unused entry is dropped once the cache is full."""
+    agent, provider = make_agent(cache_size=2)
+
+    agent.process("a")
+    agent.process("b")
+    agent.process("a")  # Hit; "b" is now least recently used.
+    agent.process("c")  # Evicts "b".
+
+    assert agent.process("a") == "response 1"
+    assert agent.process("b") == "response 4"
+    assert provider.calls == 4
+
+
+def test_clear_cache() -> None:
+    """Test cleared responses are generated again."""
+    agent, provider = make_agent(cache_size=2)
+
+    agent.process("task")
+    agent.clear_cache()
+
+    assert agent.process("task") == "response 2"
+    assert provider.calls == 2
+
+
+@pytest.mark.parametrize("input_data", ["", "   \n\t"])
+def test_process_rejects_empty_input(input_data: str) -> None:
+    """Test empty and whitespace-only input never reaches the provider."""
+    agent, provider = make_agent()
+
+    with pytest.raises(ValueError, match="Input must not be empty"):
+        agent.process(input_data)
+
+    assert provider.calls == 0
+    assert not agent.state.messages
+
+
+@pytest.mark.parametrize("input_data", ["", "   \n\t"])
+async def test_process_stream_rejects_empty_input(input_data: str) -> None:
+    """Test streaming validates input before touching state."""
+    agent, _ = make_agent()
+
+    with pytest.raises(ValueError, match="Input must not be empty"):
+        async for _chunk in agent.process_stream(input_data):
+            pass
+
+    assert not agent.state.messages
+
+
+def test_empty_input_is_rejected_before_provider_check() -> None:
+    """Test input validation runs even without a provider."""
+    agent = SolverAgent()
+
+    with pytest.raises(ValueError, match="Input must not be empty"):
+        agent.process("")
@@ -0,0 +1,130 @@
+"""Test agent state."""
+
+import json
+
+import pytest
+
+from src.agent.agent_types.agent_types import Message
+from src.agent.state.base import AgentState
+from src.llm_providers.config.provider_config import GeminiConfig
+
+
+def make_messages(count: int) -> list[Message]:
+    """Build numbered user messages."""
+    return [Message(role="user", content=str(i)) for i in range(count)]
+
+
+def test_update_sets_state_fields() -> None:
+    """Test known fields are updated and unknown keys are ignored."""
+    state = AgentState()
+
+    state.update(step_count=2, task_completed=True, unknown="x")
+
+    assert state.step_count == 2
+    assert state.task_completed
+    assert not hasattr(state, "unknown")
+
+
+def test_max_messages_evicts_oldest() -> None:
+    """Test a bounded history keeps only the newest messages."""
+    state = AgentState(max_messages=2)
+
+    for message in make_messages(3):
+        state.add_message(message)
+
+    assert [m.content for m in state.messages] == ["1", "2"]
+
+
+def test_messages_are_unbounded_by_default() -> None:
+    """Test the history has no limit unless one is set."""
+    state = AgentState()
+
+    for message in make_messages(50):
+        state.add_message(message)
+
+    assert len(state.messages) == 50
+
+
+def test_extend_messages_appends_in_order() -> None:
+    """Test batch replay keeps order and respects the history limit."""
+    state = AgentState(max_messages=3)
+    state.add_message(Message(role="system", content="start"))
+
+    state.extend_messages(make_messages(3))
+
+    assert [m.content for m in state.messages] == ["0", "1", "2"]
+
+
+def test_clear_swaps_in_fresh_containers() -> None:
+    """Test clearing resets fields and replaces the containers."""
+    state = AgentState(max_messages=2)
+    messages = state.messages
+    context = state.context
+    state.add_message(Message(role="user", content="hi"))
+    state.set_context("key", "value")
+    state.step_count = 3
+
+    state.clear()
+
+    assert state.step_count == 0
+    assert not state.messages
+    assert not state.context
+    assert state.messages is not messages
+    assert state.context is not context
+    assert state.messages.maxlen == 2
+    assert len(messages) == 1
+
+
+def test_clear_can_keep_aliases() -> None:
+    """Test clearing in place keeps existing references valid."""
+    state = AgentState(max_messages=2)
+    messages = state.messages
+    context = state.context
+    state.add_message(Message(role="user", content="hi"))
+    state.set_context("key", "value")
+
+    state.clear(keep_aliases=True)
+
+    assert state.messages is messages
+    assert state.context is context
+    assert not messages
+    assert not context
+    assert state.messages.maxlen == 2
+
+
+def test_to_bytes_serializes_snapshot() -> None:
+    """Test the snapshot holds every field, with messages as plain objects."""
+    state = AgentState()
+    state.add_message(Message(role="user", content="hi"))
+    state.set_context("attempts", 1)
+    state.record_error(ValueError("bad"))
+
+    snapshot = json.loads(state.to_bytes())
+
+    assert set(snapshot) == set(AgentState.__slots__)
+    assert snapshot["messages"] == [
+        {"role": "user", "content": "hi", "metadata": {}},
+    ]
+    assert snapshot["context"] == {"attempts": 1}
+    assert snapshot["error_type"] == "ValueError"
+    assert snapshot["error_msg"] == "bad"
+
+
+def test_to_bytes_rejects_unencodable_context() -> None:
+    """Test values without a JSON form raise TypeError."""
+    state = AgentState()
+    state.set_context("handle", object())
+
+    with pytest.raises(TypeError):
+        state.to_bytes()
+
+
+def test_to_bytes_encodes_provider_config() -> None:
+    """Test a provider config in the context is encoded as an object."""
+    state = AgentState()
+    state.set_context("provider", GeminiConfig(api_key="k"))
+
+    snapshot = json.loads(state.to_bytes())
+
+    assert snapshot["context"]["provider"]["api_key"] == "k"
+    assert snapshot["context"]["provider"]["extra_params"] == {}
@@ -0,0 +1,214 @@
+"""Test step execution."""
+
+import anyio
+import pytest
+
+from src.agent.agent_types.enums import AgentStatus
+from src.agent.state.base import AgentState
+from src.agent.steps import BaseStepExecutor, Step, get_current_state
+
+
+class MockExecutor(BaseStepExecutor):
+    """Mock step executor for testing."""
+
+    def _execute_step(self, step: Step) -> str:
+        """Execute a step."""
+        return step.func(AgentState())
+
+
+class FlakyStep:
+    """Step function that fails a fixed number of times."""
+
+    def __init__(self, failures: int) -> None:
+        """Initialize flaky step.
+
+        Args:
+            failures: Number of calls that raise before succeeding.
+
+        """
+        self.failures = failures
+        self.calls = 0
+
+    def __call__(self, _state: AgentState, **_kwargs: str) -> str:
+        """Run the step."""
+        self.calls += 1
+        if self.calls <= self.failures:
+            msg = "Step failed"
+            raise ValueError(msg)
+        return "done"
+
+
+def test_execute_step_retries_until_success() -> None:
+    """Test failed attempts are retried in a loop."""
+    executor = MockExecutor()
+    state = AgentState()
+    func = FlakyStep(failures=2)
+
+    result = executor.execute_step(Step("flaky", func, []), state)
+
+    assert result == "done"
+    assert func.calls == 3
+    assert state.step_count == 3
+    assert state.retry_count == 0
+    assert state.status == AgentStatus.DONE
+
+
+def test_execute_step_raises_after_max_retries() -> None:
+    """Test step failure once retries are exhausted."""
+    executor = MockExecutor()
+    state = AgentState()
+    func = FlakyStep(failures=5)
+
+    with pytest.raises(RuntimeError, match="Step 'flaky' failed"):
+        executor.execute_step(Step("flaky", func, [], max_retries=1), state)
+
+    assert func.calls == 2
+    assert state.status == AgentStatus.ERROR
+    assert state.error_type == "ValueError"
+    assert state.error_msg == "Step failed"
+
+
+def test_execute_step_without_retry() -> None:
+    """Test steps with retry disabled fail on the first error."""
+    executor = MockExecutor()
+    state = AgentState()
+    func = FlakyStep(failures=1)
+
+    with pytest.raises(RuntimeError):
+        executor.execute_step(Step("flaky", func, [], retry_on_error=False), state)
+
+    assert func.calls == 1
+
+
+def test_execute_step_validates_inputs() -> None:
+    """Test missing required keys are rejected."""
+    executor = MockExecutor()
+
+    with pytest.raises(ValueError, match="Missing required keys: task"):
+        executor.execute_step(Step("step", FlakyStep(0), ["task"]), AgentState())
+
+
+async def test_aexecute_step_retries_with_backoff() -> None:
+    """Test async execution retries and awaits coroutine step functions."""
+    executor = MockExecutor(retry_delay=0.001)
+    state = AgentState()
+    func = FlakyStep(failures=1)
+
+    async def step_func(state: AgentState) -> str:
+        return func(state)
+
+    result = await executor.aexecute_step(Step("flaky", step_func, []), state)
+
+    assert result == "done"
+    assert func.calls == 2
+    assert state.status == AgentStatus.DONE
+
+
+async def test_retry_delay_is_capped(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test exponential backoff respects the maximum delay."""
+    delays: list[float] = []
+
+    async def record_sleep(delay: float) -> None:
+        delays.append(delay)
+
+    monkeypatch.setattr(anyio, "sleep", record_sleep)
+    executor = MockExecutor(retry_delay=1.0, max_retry_delay=3.0)
+    step = Step("flaky", FlakyStep(failures=4), [], max_retries=4)
+
+    await executor.aexecute_step(step, AgentState())
+
+    assert delays == [1.0, 2.0, 3.0, 3.0]
+
+
+async def test_execute_batch_runs_dependent_steps_in_waves() -> None:
+    """Test independent steps run together and dependents get their results."""
+    executor = MockExecutor()
+    state = AgentState()
+
+    async def first(_state: AgentState, **kwargs: str) -> str:
+        return f"first:{kwargs['task']}"
+
+    def second(_state: AgentState, **_kwargs: str) -> str:
+        return "second"
+
+    def combine(_state: AgentState, **kwargs: str) -> str:
+        return f"{kwargs['first']}+{kwargs['second']}"
+
+    results = await executor.execute_batch(
+        [
+            Step("combine", combine, ["first", "second"]),
+            Step("first", first, ["task"]),
+            Step("second", second, []),
+        ],
+        state,
+        task="t",
+    )
+
+    assert results == {
+        "first": "first:t",
+        "second": "second",
+        "combine": "first:t+second",
+    }
+    assert state.step_count == 3
+
+
+async def test_execute_batch_passes_only_declared_inputs() -> None:
+    """Test steps with fixed signatures only get the keys they declare."""
+    executor = MockExecutor()
+
+    def plan(_state: AgentState, task: str) -> str:
+        return f"plan:{task}"
+
+    def code(_state: AgentState, plan: str, style: str = "plain") -> str:
+        return f"{plan}:{style}"
+
+    results = await executor.execute_batch(
+        [
+            Step("plan", plan, ["task"]),
+            Step("code", code, ["plan"], optional_keys=["style"]),
+        ],
+        AgentState(),
+        task="t",
+        style="tidy",
+        unused="x",
+    )
+
+    assert results == {"plan": "plan:t", "code": "plan:t:tidy"}
+
+
+async def test_execute_batch_rejects_unsatisfiable_steps() -> None:
+    """Test steps whose required keys never become available are rejected."""
+    executor = MockExecutor()
+
+    with pytest.raises(ValueError, match="Missing required keys: missing"):
+        await executor.execute_batch(
+            [Step("step", FlakyStep(0), ["missing"])],
+            AgentState(),
+        )
+
+
+async def test_execute_batch_rejects_duplicate_names() -> None:
+    """Test steps sharing a name are rejected before any step runs."""
+    executor = MockExecutor()
+    func = FlakyStep(failures=0)
+
+    with pytest.raises(ValueError, match="Step names in a batch must be unique"):
+        await executor.execute_batch(
+            [Step("step", func, []), Step("step", func, [])],
+            AgentState(),
+        )
+
+    assert func.calls == 0
+
+
+def test_current_state_is_bound_during_step() -> None:
+    """Test helpers can reach the executing step's state."""
+    executor = MockExecutor()
+    state = AgentState()
+
+    def step_func(_state: AgentState) -> AgentState:
+        return get_current_state()
+
+    assert executor.execute_step(Step("step", step_func, []), state) is state
+    with pytest.raises(LookupError):
+        get_current_state()